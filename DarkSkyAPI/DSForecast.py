@@ -1,12 +1,23 @@
+from array import array
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:
+    ZoneInfo = None
+    ZoneInfoNotFoundError = KeyError
 
 from DarkSkyAPI.DS_logger import logger
 
+NAN = float('nan')
+
 # TODO:: Update docstrings
 
 class DSFMBase:
 
-    def __init__(self, data:dict, time_a:int=None):
+    def __init__(self, data:dict, time_a:int=None, tz:str=None):
         """Constructor method.
 
         Sets base attributes from data dict.
@@ -14,6 +25,9 @@ class DSFMBase:
         Arguments:
             data {dict} -- A dict containing the daily or hourly data from the DarkSkyAPI.
 
+        Keyword Arguments:
+            tz {str} -- IANA timezone used to format times, local time when None (default: {None})
+
         Attributes:
             data {list} -- A list containing the day and hour forecast data
             summary {str} -- A summary of the daily or hourly forecast
@@ -24,7 +38,61 @@ class DSFMBase:
         self.general_summary = data['summary']
         self.general_icon = data['icon']
         self.time_a = time_a
-        logger.info(f"{repr(self)} created")
+        self.timezone = tz
+        self._columns = {}
+        self._missing = set()
+        logger.info("%r created", self)
+
+    @property
+    def columns(self):
+        """dict: the datablock transposed to one typed column per datapoint."""
+        for row in self.data:
+            for datapoint in row:
+                if datapoint not in self._columns:
+                    self._build_column(datapoint)
+        return self._columns
+
+    def _build_column(self, datapoint:str):
+        # Columnar data sources, such as snapshot files, hand out their stored columns directly
+        stored = getattr(self.data, "column", None)
+        column, missing = stored(datapoint) if stored else to_column(self.data, datapoint)
+        if missing:
+            self._missing.add(datapoint)
+        self._columns[datapoint] = column
+        return column
+
+    def typed_column(self, datapoint:str):
+        """Returns the stored column of a datapoint: an array with NaN for missing values or a list with None.
+
+        Arguments:
+            datapoint {str} -- The forecast datapoint you want the values of (example: windSpeed)
+
+        Returns:
+            array -- The column, not to be modified
+        """
+        column = self._columns.get(datapoint)
+        if column is None:
+            column = self._build_column(datapoint)
+        return column
+
+    def column(self, datapoint:str, n:int=None):
+        """Returns the first n values of a datapoint column as a list, with None for missing values.
+
+        The column is transposed from the data list once, on first use.
+
+        Arguments:
+            datapoint {str} -- The forecast datapoint you want the values of (example: windSpeed)
+
+        Keyword Arguments:
+            n {int} -- Amount of values to return (default: {all})
+
+        Returns:
+            list -- A list containing single datapoint values
+        """
+        column = self.typed_column(datapoint)
+        if datapoint in self._missing and isinstance(column, array):
+            return [None if v != v else v for v in column[:n]]
+        return column[:n].tolist() if isinstance(column, array) else column[:n]
     
     def data_pair(self, datapoint:str, date_fmt:str='%d-%m-%Y %H:%M', graph:bool=False):
         """Generates a list of value pairs containing datetimes and datapoint values.
@@ -41,13 +109,13 @@ class DSFMBase:
             list -- list of tuple value pairs
             dict -- graph-friendly dict when graph set to True 
         """
-        time_range = get_time_range(self, self.time_a)
+        n = get_time_range(self, self.time_a).stop
+        times = self.datetimes(date_fmt)
+        values = self.column(datapoint, n)
         if graph:
-            return dict(x=[timestamp(self.data[tr].get('time', None), date_fmt) for tr in time_range],
-                        y=[self.data[tr].get(datapoint, None) for tr in time_range])
+            return dict(x=times, y=values)
         else:
-            return [(timestamp(self.data[tr].get('time', None), date_fmt), self.data[tr].get(datapoint, None))
-                    for tr in time_range]
+            return list(zip(times, values))
     
     def data_single(self, datapoint:str, to_percent=False, to_datetime=False):
         """Generates a list of single datapoint values.
@@ -63,15 +131,16 @@ class DSFMBase:
         Returns:
             list -- A list containing single datapoint values
         """
-        time_range = get_time_range(self, self.time_a)
+        n = get_time_range(self, self.time_a).stop
+        values = self.column(datapoint, n)
         if to_percent:
-            return [int(self.data[tr].get(datapoint, None) * 100) if datapoint in self.data[tr] else None
-                    for tr in time_range]
+            if datapoint in self._missing:
+                return [int(v * 100) if v is not None else None for v in values]
+            return list(map(int, map((100.0).__mul__, values)))
         elif to_datetime:
-            return [timestamp(self.data[tr].get(datapoint, None), "%d-%m-%Y %H:%M") if datapoint in self.data[tr]
-                    else None for tr in time_range]
+            return timestamps(values, "%d-%m-%Y %H:%M", self.timezone)
         else:
-            return [self.data[tr].get(datapoint, None) if datapoint in self.data[tr] else None for tr in time_range]
+            return values
 
     def data_combined(self, datalist:list=None, date_fmt="%d-%m-%Y %H:%M"):
         """Generates a custom dict of datapoint values for each day/hour.
@@ -87,14 +156,12 @@ class DSFMBase:
             dict -- A dict of datapoints and their corresponding values. If no list is provided, all datapoints will
             be used.
         """
-        time_range = get_time_range(self, self.time_a)
+        n = get_time_range(self, self.time_a).stop
         if datalist:
-            return {datapoint: [timestamp(self.data[tr].get(datapoint, None), date_fmt)
-                                if datapoint.lower().find("time") >= 0
-                    else self.data[tr].get(datapoint, None) for tr in time_range] for datapoint in datalist}
+            return {datapoint: timestamps(self.column(datapoint, n), date_fmt, self.timezone)
+                    if datapoint.lower().find("time") >= 0 else self.column(datapoint, n) for datapoint in datalist}
         else:
-            datalist = [datakey for datakey in self.data[0].keys()]
-            return {datapoint: [self.data[tr].get(datapoint, None) for tr in time_range] for datapoint in datalist}
+            return {datapoint: self.column(datapoint, n) for datapoint in self.data[0].keys()}
 
     def datetimes(self, date_fmt:str="%d-%m-%Y %H:%M"):
         """Generates a list of datetime strings of all the hours/days.
@@ -108,8 +175,8 @@ class DSFMBase:
         Returns:
             list -- A list of datetime strings of all the hours/days
         """
-        time_range = get_time_range(self, self.time_a)
-        return [timestamp(self.data[tr].get('time', None), date_fmt) for tr in time_range]
+        n = get_time_range(self, self.time_a).stop
+        return timestamps(self.column('time', n), date_fmt, self.timezone)
 
     @property
     def time(self):
@@ -202,17 +269,21 @@ class DSFMBase:
 
 class DSFCurrent:
 
-    def __init__(self, data:dict):
+    def __init__(self, data:dict, tz:str=None):
         """Constructor method for Current class.
 
         Sets attributes automatically according to data["currently"].
          
         Arguments:
             data {dict} -- A dict containing the daily or hourly data from the DarkSkyAPI.
+
+        Keyword Arguments:
+            tz {str} -- IANA timezone used to format times, local time when None (default: {None})
         """
+        self.timezone = tz
         for k, v in data.items():
             setattr(self, k, v)
-        logger.info(f"{repr(self)} created")
+        logger.info("%r created", self)
 
     def _weekday(self, short:bool=False):
         """Gets the week day name for today
@@ -224,9 +295,9 @@ class DSFCurrent:
             str -- Week day name
         """
         if short:
-            return timestamp(self.time, "%a")
+            return timestamp(self.time, "%a", self.timezone)
         else:
-            return timestamp(self.time, "%A")
+            return timestamp(self.time, "%A", self.timezone)
 
     def _is_raining(self):
         return self.precipProbability > 0
@@ -250,7 +321,7 @@ class DSFCurrent:
 
 class DSFDaily(DSFMBase):
 
-    def __init__(self, data:dict, time_a:int):
+    def __init__(self, data:dict, time_a:int, tz:str=None):
         """Constructor method for Daily class.
         
         Sets attributes automatically according to data["daily"]. Inherits base attributes, methods and 
@@ -258,8 +329,11 @@ class DSFDaily(DSFMBase):
 
         Arguments:
             data {dict} -- A dict containing the daily data from the DarkSkyAPI.
+
+        Keyword Arguments:
+            tz {str} -- IANA timezone used to format times, local time when None (default: {None})
         """
-        super().__init__(data, time_a)
+        super().__init__(data, time_a, tz)
         for i in range(0, time_a + 1):
             setattr(self, 'day_' + str(i), data['data'][i])
     
@@ -341,7 +415,7 @@ class DSFDaily(DSFMBase):
 
 class DSFHourly(DSFMBase):
 
-    def __init__(self, data:dict, time_a:int):
+    def __init__(self, data:dict, time_a:int, tz:str=None):
         """Constructor method for Hourly class.
         
         Sets attributes automatically according to data["hourly"]. Inherits base attributes, methods and 
@@ -349,8 +423,11 @@ class DSFHourly(DSFMBase):
 
         Arguments:
             data {dict} -- A dict containing the hourly data from the DarkSkyAPI.
+
+        Keyword Arguments:
+            tz {str} -- IANA timezone used to format times, local time when None (default: {None})
         """
-        super().__init__(data, time_a)
+        super().__init__(data, time_a, tz)
         for i in range(0, time_a + 1):
             setattr(self, 'hour_' + str(i), data['data'][i])
     
@@ -367,7 +444,7 @@ class DSFHourly(DSFMBase):
 
 class DSFMinutely(DSFMBase):
 
-    def __init__(self, data:dict, time_a:int):
+    def __init__(self, data:dict, time_a:int, tz:str=None):
         """Constructor method for Minutely class.
         
         Sets attributes automatically according to data["minutely"]. Inherits base attributes, methods and 
@@ -375,23 +452,90 @@ class DSFMinutely(DSFMBase):
 
         Arguments:
             data {dict} -- A dict containing the minutely data from the DarkSkyAPI.
+
+        Keyword Arguments:
+            tz {str} -- IANA timezone used to format times, local time when None (default: {None})
         """
-        super().__init__(data, time_a)
+        super().__init__(data, time_a, tz)
         for i in range(0, time_a + 1):
             setattr(self, 'minute_' + str(i), data['data'][i])
         
 
-def timestamp(dt:int, fmt:str):
+@lru_cache(maxsize=64)
+@lru_cache(maxsize=None)
+def _zone(tz:str):
+    if tz is None:
+        return None
+    if ZoneInfo is None:
+        logger.warning("zoneinfo is not available, formatting %s times in local time", tz)
+        return None
+    try:
+        return ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        # Systems without an IANA database, such as Windows without the tzdata package
+        logger.warning("Timezone %s is not available, formatting its times in local time", tz)
+        return None
+
+
+@lru_cache(maxsize=65536)
+def timestamp(dt:int, fmt:str, tz:str=None):
     """Helper function to convert timestamp to string
+
+    Results are memoized per (timestamp, format, timezone).
     
     Arguments:
         dt {int} -- timestamp
         fmt {str} -- datetime format
+
+    Keyword Arguments:
+        tz {str} -- IANA timezone name (example: Europe/Amsterdam), local time when None (default: {None})
     
     Returns:
         str -- datetime string
     """
-    return datetime.fromtimestamp(int(dt)).strftime(fmt)
+    return datetime.fromtimestamp(int(dt), _zone(tz)).strftime(fmt)
+
+
+def timestamps(column, fmt:str, tz:str=None):
+    """Helper function to convert a column of timestamps to strings, keeping None for missing values.
+
+    Arguments:
+        column {list} -- timestamps
+        fmt {str} -- datetime format
+
+    Keyword Arguments:
+        tz {str} -- IANA timezone name, local time when None (default: {None})
+
+    Returns:
+        list -- datetime strings
+    """
+    if isinstance(column, array):
+        return list(map(timestamp, column, repeat(fmt), repeat(tz)))
+    return [timestamp(v, fmt, tz) if v is not None else None for v in column]
+
+
+def to_column(rows:list, datapoint:str):
+    """Helper function to transpose one datapoint of a list of datapoint dicts into a typed column.
+
+    Integer columns without missing values become array('q'), numeric columns become array('d') with NaN for
+    missing values and all other columns (strings or integers with gaps) become lists with None.
+
+    Arguments:
+        rows {list} -- The data list of a datablock
+        datapoint {str} -- The datapoint to transpose
+
+    Returns:
+        tuple -- The column and a boolean which is True when values are missing
+    """
+    values = [row.get(datapoint) for row in rows]
+    missing = None in values
+    types = set(map(type, values))
+    types.discard(type(None))
+    if types == {int} and not missing:
+        return array('q', values), missing
+    elif float in types and types <= {int, float}:
+        return array('d', [NAN if v is None else v for v in values]), missing
+    return values, missing
 
 
 def get_time_range(obj, t):
@@ -406,11 +550,11 @@ def get_time_range(obj, t):
     if not t:
         if isinstance(obj, DSFDaily):
             time_range = range(0, 8)
-            logger.info(f"{time_range} created for {repr(obj)}")
+            logger.info("%s created for %r", time_range, obj)
         else:
             time_range = range(0, 49)
-            logger.info(f"{time_range} created for {repr(obj)}")
+            logger.info("%s created for %r", time_range, obj)
     else:
         time_range = range(0, t)
-        logger.info(f"{time_range} created for {repr(obj)}")
+        logger.info("%s created for %r", time_range, obj)
     return time_range
@@ -0,0 +1,119 @@
+import warnings
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_time_series_blocks = ("minutely", "hourly", "daily")
+
+
+def _as_floats(column):
+    if isinstance(column, array):
+        return np.frombuffer(column, dtype=np.float64 if column.typecode == 'd' else np.int64).astype(np.float64)
+    return np.array([np.nan if v is None else v for v in column], dtype=np.float64)
+
+
+class FieldStack:
+
+    def __init__(self, clients:list, block:str, datapoint:str, n:int=None):
+        """Constructor method.
+
+        Stacks one datapoint of many forecasts into a 2-D locations x time array. The columns are the union of the
+        times of all forecasts, so every column holds the values of one moment. Missing values, which data_single
+        returns as None, and times a forecast has no point for are NaN and ignored by the reductions.
+
+        Arguments:
+            clients {list} -- DarkSkyClient instances
+            block {str} -- The datablock (example: hourly)
+            datapoint {str} -- The forecast datapoint (example: windGust)
+
+        Keyword Arguments:
+            n {int} -- Amount of days/hours/minutes to use (default: {all})
+
+        Attributes:
+            locations {list} -- The (latitude, longitude) tuple of every row
+            times {numpy.ndarray} -- The sorted UNIX times of the columns
+            values {numpy.ndarray} -- The values, shape (locations, time)
+        """
+        if np is None:
+            raise ImportError("FieldStack requires numpy: pip install numpy")
+        if block not in _time_series_blocks:
+            raise ValueError(f"{block} is not a datablock with a time series")
+        self.block = block
+        self.datapoint = datapoint
+        self.locations = []
+        rows = []
+        row_times = []
+        for client in clients:
+            view = getattr(client, block)
+            if view is None:
+                continue
+            rows.append(_as_floats(view.typed_column(datapoint))[:n])
+            row_times.append(_as_floats(view.typed_column('time'))[:n].astype(np.int64))
+            self.locations.append(tuple(client.location))
+        # Forecasts fetched at different hours or in other timezones start at other times, rows are placed by time
+        self.times = np.unique(np.concatenate(row_times)) if row_times else np.empty(0, dtype=np.int64)
+        self.values = np.full((len(rows), len(self.times)), np.nan)
+        for i, (row, times) in enumerate(zip(rows, row_times)):
+            self.values[i, np.searchsorted(self.times, times)] = row
+
+    @property
+    def missing(self):
+        """numpy.ndarray: boolean mask of the missing values."""
+        return np.isnan(self.values)
+
+    def min(self, axis:int=1):
+        """Minimum per location (axis=1) or per time (axis=0), NaN where all values are missing."""
+        return self._nan_reduce(np.nanmin, axis)
+
+    def max(self, axis:int=1):
+        """Maximum per location (axis=1) or per time (axis=0)."""
+        return self._nan_reduce(np.nanmax, axis)
+
+    def mean(self, axis:int=1):
+        """Mean per location (axis=1) or per time (axis=0)."""
+        return self._nan_reduce(np.nanmean, axis)
+
+    def percentile(self, q, axis:int=1):
+        """The q-th percentile(s) per location (axis=1) or per time (axis=0)."""
+        return self._nan_reduce(lambda values, axis: np.nanpercentile(values, q, axis=axis), axis)
+
+    def count_above(self, threshold:float, axis:int=1):
+        """Amount of values greater than threshold per location (axis=1) or per time (axis=0)."""
+        with np.errstate(invalid='ignore'):
+            return np.sum(self.values > threshold, axis=axis)
+
+    def count_below(self, threshold:float, axis:int=1):
+        """Amount of values smaller than threshold per location (axis=1) or per time (axis=0)."""
+        with np.errstate(invalid='ignore'):
+            return np.sum(self.values < threshold, axis=axis)
+
+    def rolling(self, window:int, func:str="mean"):
+        """Rolling reduction over the time axis.
+
+        Arguments:
+            window {int} -- Amount of points per window
+
+        Keyword Arguments:
+            func {str} -- One of "mean", "min", "max" or "sum" (default: {"mean"})
+
+        Returns:
+            numpy.ndarray -- Shape (locations, time - window + 1)
+        """
+        reducers = dict(mean=np.nanmean, min=np.nanmin, max=np.nanmax, sum=np.nansum)
+        if func not in reducers:
+            raise ValueError(f"func must be one of {list(reducers)}")
+        windows = np.lib.stride_tricks.sliding_window_view(self.values, window, axis=1)
+        return self._nan_reduce(reducers[func], axis=2, values=windows)
+
+    def _nan_reduce(self, reducer, axis, values=None):
+        values = self.values if values is None else values
+        with warnings.catch_warnings():
+            # All-NaN slices are expected for locations or times without data and come out as NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return reducer(values, axis=axis)
+
+    def __repr__(self):
+        return f"FieldStack({self.block}.{self.datapoint}, {len(self.locations)} locations x {len(self.times)} points)"
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient, FetchResult
+from DarkSkyAPI.DS_logger import logger
+from DarkSkyAPI.DS_metrics import emit, hooks
+
+
+class AsyncDarkSkyClient(DarkSkyClient):
+
+    def __init__(self, api_key:str, location:tuple, units:str="si", exclude:list=None, lang=None,
+                 session=None, cache=None, time=None, quota=None, singleflight=None, grid:float=None):
+        """Constructor method for the asyncio client.
+
+        Unlike DarkSkyClient the constructor does not touch the network, the forecast is requested by awaiting
+        fetch(). Urls are built with the same rules as the synchronous client and the currently, daily, hourly
+        and minutely properties return the same DSF views once the data is fetched.
+
+        Arguments:
+            api_key {str} -- The DarkSky API key
+            location {tuple} -- A (latitude, longitude) tuple
+
+        Keyword Arguments:
+            units {str} -- Units of the response (default: {"si"})
+            exclude {list} -- Datablocks to exclude (default: {None})
+            lang {str} -- Language of the summaries (default: {None})
+            session {aiohttp.ClientSession} -- Session shared by many clients. A single-use session is created
+            for each fetch when omitted (default: {None})
+            cache {MemoryCache} -- Response cache consulted before requesting (default: {None})
+            time {int} -- UNIX time or ISO 8601 string, requests historical data for that time (default: {None})
+            quota {QuotaLimiter} -- Shared quota and rate limiter, waited on in the default executor (default: {None})
+            singleflight {AsyncSingleFlight} -- Shares one request between concurrent fetches of the same url
+            (default: {None})
+            grid {float} -- Snaps the coordinates to a grid of this size in degrees (default: {None})
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncDarkSkyClient requires aiohttp: pip install aiohttp")
+        super().__init__(api_key, location, units, exclude, lang, session=session, cache=cache, lazy=True, time=time,
+                         quota=quota, singleflight=singleflight, grid=grid)
+
+    async def fetch(self):
+        """Requests the forecast and stores it on the client.
+
+        Returns:
+            AsyncDarkSkyClient -- The client itself, so it can be awaited inline
+        """
+        self._store(*await self._request())
+        return self
+
+    async def refresh_incremental(self, max_age:float=None, force:bool=False):
+        """Fetches the forecast when it is stale and only invalidates the views of the datablocks that changed.
+
+        The awaitable counterpart of DarkSkyClient.refresh_incremental, subscribers are called with the diff.
+
+        Keyword Arguments:
+            max_age {float} -- Maximum age of the data in seconds, see is_stale (default: {None})
+            force {bool} -- Request the forecast regardless of the age of the data, bypassing the cache
+            (default: {False})
+
+        Returns:
+            dict -- The diff, empty when nothing changed or nothing was fetched
+        """
+        if not force and not self.is_stale(max_age):
+            return {}
+        return self._apply_incremental(*await self._request(force))
+
+    def refresh(self, max_age:float=None, force:bool=False):
+        raise RuntimeError("AsyncDarkSkyClient can't fetch synchronously, use 'await client.fetch()'")
+
+    async def _request(self, force:bool=False):
+        if self.session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._get_response_async(session, force)
+        return await self._get_response_async(self.session, force)
+
+    async def _get_response_async(self, session, force:bool=False):
+        """Returns the response and the time it was fetched, from the cache unless force is set."""
+        url = self._url_builder()
+        if self.cache is not None and not force:
+            entry = self.cache.get_entry(self.cache_key)
+            if hooks:
+                emit("cache", hit=entry is not None)
+            if entry is not None:
+                logger.debug("cache hit: %s", url)
+                return entry
+        if self.singleflight is not None:
+            data = await self.singleflight.do(url, lambda: self._fetch_async(session, url))
+        else:
+            data = await self._fetch_async(session, url)
+        return data, time.time()
+
+    async def _fetch_async(self, session, url:str):
+        if self.quota is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.quota.acquire)
+        start = time.perf_counter()
+        try:
+            async with session.get(url) as raw_response:
+                raw_response.raise_for_status()
+                headers_seconds = time.perf_counter() - start
+                body = await raw_response.read()
+        except Exception as e:
+            if hooks:
+                emit("error", phase="request", error=type(e).__name__, url=url)
+            raise
+        if hooks:
+            self._emit_request(url, raw_response.status, raw_response.headers, headers_seconds,
+                               time.perf_counter() - start - headers_seconds, len(body))
+        if self.quota is not None:
+            # QuotaLimiter.update locks the SQLite file, which must not block the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self._count_api_calls, raw_response.headers)
+        else:
+            self._count_api_calls(raw_response.headers)
+        start = time.perf_counter()
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            if hooks:
+                emit("error", phase="decode", error=type(e).__name__, url=url)
+            raise
+        if hooks:
+            emit("decode", seconds=time.perf_counter() - start, bytes=len(body), lazy=False)
+        if self.cache is not None:
+            self.cache.set(self.cache_key, data)
+        return data
+
+    @classmethod
+    async def fetch_many(cls, api_key:str, locations:list, units:str="si", exclude:list=None, lang=None,
+                         max_concurrency:int=100, session=None, **kwargs):
+        """Fetches the forecasts of many locations concurrently over one shared connection pool.
+
+        Arguments:
+            api_key {str} -- The DarkSky API key
+            locations {list} -- A list of (latitude, longitude) tuples
+
+        Keyword Arguments:
+            units {str} -- Units of every request (default: {"si"})
+            exclude {list} -- Datablocks to exclude from every request (default: {None})
+            lang {str} -- Language of the summaries (default: {None})
+            max_concurrency {int} -- Maximum amount of requests in flight (default: {100})
+            session {aiohttp.ClientSession} -- Session to use, one is created for the sweep when omitted
+            (default: {None})
+
+        Yields:
+            FetchResult -- (location, client, error) tuples in order of completion
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncDarkSkyClient requires aiohttp: pip install aiohttp")
+        own_session = session is None
+        if own_session:
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=max_concurrency))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(location):
+            async with semaphore:
+                client = cls(api_key, location, units, exclude, lang, session=session, **kwargs)
+                try:
+                    return FetchResult(location, await client.fetch(), None)
+                except Exception as e:
+                    logger.error("Request for %s failed: %r", location, e)
+                    return FetchResult(location, None, e)
+
+        tasks = [asyncio.ensure_future(fetch_one(location)) for location in locations]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            if own_session:
+                await session.close()
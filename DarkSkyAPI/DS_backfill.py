@@ -0,0 +1,128 @@
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_logger import logger
+
+BackfillRecord = namedtuple("BackfillRecord", ["location", "date", "data", "error"])
+
+
+def date_grid(locations:list, start:date, end:date):
+    """Generates every (location, date) pair between start and end, both inclusive.
+
+    Arguments:
+        locations {list} -- A list of (latitude, longitude) tuples
+        start {date} -- First day
+        end {date} -- Last day
+
+    Yields:
+        tuple -- (location, date) pairs, all days of a location before the next location
+    """
+    days = (end - start).days
+    for location in locations:
+        for i in range(days + 1):
+            yield tuple(location), start + timedelta(days=i)
+
+
+class Checkpoint:
+
+    def __init__(self, path:str):
+        """Constructor method.
+
+        Keeps the finished (location, date) pairs of a backfill in an append-only text file, so an interrupted
+        run can resume without requesting them again.
+
+        Arguments:
+            path {str} -- Path of the checkpoint file, created when missing
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._done = set()
+        if os.path.exists(path):
+            with open(path) as fh:
+                self._done.update(line.strip() for line in fh if line.strip())
+        self._fh = open(path, "a")
+
+    @staticmethod
+    def key(location:tuple, day:date):
+        return f"{location[0]},{location[1]},{day.isoformat()}"
+
+    def __contains__(self, item:tuple):
+        return self.key(*item) in self._done
+
+    def __len__(self):
+        return len(self._done)
+
+    def mark(self, location:tuple, day:date):
+        """Records a (location, date) pair as finished."""
+        key = self.key(location, day)
+        with self._lock:
+            if key not in self._done:
+                self._done.add(key)
+                self._fh.write(key + "\n")
+                self._fh.flush()
+
+    def close(self):
+        self._fh.close()
+
+
+def backfill(api_key:str, locations:list, start:date, end:date, checkpoint:str=None, max_workers:int=8,
+             client_cls=DarkSkyClient, **kwargs):
+    """Requests historical (Time Machine) data for every location and day between start and end.
+
+    At most max_workers requests are in flight and only as many are queued, so the grid is never held in memory.
+    A pair is written to the checkpoint once its record has been consumed, pairs that are already in the
+    checkpoint are skipped and failed pairs are left out so the next run retries them.
+
+    Arguments:
+        api_key {str} -- The DarkSky API key
+        locations {list} -- A list of (latitude, longitude) tuples
+        start {date} -- First day
+        end {date} -- Last day, inclusive
+
+    Keyword Arguments:
+        checkpoint {str} -- Path of the checkpoint file (default: {None})
+        max_workers {int} -- Maximum amount of requests in flight (default: {8})
+        client_cls {type} -- Client class used for the requests (default: {DarkSkyClient})
+        kwargs -- Any other keyword argument accepted by the client constructor (example: units, exclude)
+
+    Yields:
+        BackfillRecord -- (location, date, data, error) tuples in order of completion
+    """
+    done = Checkpoint(checkpoint) if checkpoint else None
+    pending = (pair for pair in date_grid(locations, start, end) if done is None or pair not in done)
+
+    def fetch(location, day):
+        client = client_cls(api_key, location, time=f"{day.isoformat()}T00:00:00", lazy=True, **kwargs)
+        return client.raw_data
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {}
+    try:
+        while True:
+            for location, day in pending:
+                futures[executor.submit(fetch, location, day)] = (location, day)
+                if len(futures) >= max_workers * 2:
+                    break
+            if not futures:
+                break
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                location, day = futures.pop(future)
+                try:
+                    record = BackfillRecord(location, day, future.result(), None)
+                except Exception as e:
+                    logger.error("Backfill of %s on %s failed: %r", location, day, e)
+                    record = BackfillRecord(location, day, None, e)
+                yield record
+                if done is not None and record.error is None:
+                    done.mark(location, day)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if done is not None:
+            done.close()
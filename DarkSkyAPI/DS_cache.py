@@ -0,0 +1,191 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from DarkSkyAPI.DS_lazy import LazyForecast
+from DarkSkyAPI.DS_logger import logger
+
+# Seconds a datablock stays fresh. A cached response expires with its shortest lived datablock.
+DEFAULT_TTLS = {
+    "currently": 60,
+    "minutely": 60,
+    "hourly": 900,
+    "daily": 3600,
+    "alerts": 900,
+    "flags": 3600,
+}
+
+
+def response_ttl(data:dict, ttls:dict=None):
+    """Returns the time-to-live of a response, the TTL of the shortest lived datablock it contains.
+
+    Arguments:
+        data {dict} -- A raw DarkSky response
+
+    Keyword Arguments:
+        ttls {dict} -- Datablock name to time-to-live in seconds (default: {DEFAULT_TTLS})
+
+    Returns:
+        int -- Time-to-live in seconds
+    """
+    ttls = ttls or DEFAULT_TTLS
+    block_ttls = [ttl for block, ttl in ttls.items() if block in data]
+    return min(block_ttls) if block_ttls else min(ttls.values())
+
+
+class BaseCache(ABC):
+
+    def __init__(self, maxsize:int=1024, ttls:dict=None):
+        """Constructor method.
+
+        Keyword Arguments:
+            maxsize {int} -- Maximum amount of cached responses before the least recently used is evicted
+            (default: {1024})
+            ttls {dict} -- Datablock name to time-to-live in seconds, merged over DEFAULT_TTLS (default: {None})
+        """
+        self.maxsize = maxsize
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def ttl(self, data:dict):
+        """Returns the time-to-live of a response using the TTLs of this cache."""
+        return response_ttl(data, self.ttls)
+
+    @property
+    def stats(self):
+        """dict: hit, miss and eviction counters."""
+        return dict(hits=self.hits, misses=self.misses, evictions=self.evictions)
+
+    def get(self, key:str):
+        """Returns the cached response for key or None if it is missing or expired."""
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    @abstractmethod
+    def get_entry(self, key:str):
+        """Returns a (response, stored_at) tuple for key, with the UNIX time the response was cached, or None if
+        it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key:str, data:dict):
+        """Caches a response under key."""
+
+    @abstractmethod
+    def clear(self):
+        """Removes every cached response."""
+
+    @abstractmethod
+    def __len__(self):
+        """Returns the amount of cached responses."""
+
+
+class MemoryCache(BaseCache):
+
+    def __init__(self, maxsize:int=1024, ttls:dict=None):
+        super().__init__(maxsize, ttls)
+        self._entries = OrderedDict()
+
+    def get_entry(self, key:str):
+        """Returns the cached response for key and the time it was cached, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2], entry[1]
+
+    def set(self, key:str, data:dict):
+        """Caches a response, evicting the least recently used entries when the cache is full."""
+        now = time.time()
+        with self._lock:
+            self._entries[key] = (now + self.ttl(data), now, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache(BaseCache):
+
+    def __init__(self, path:str, maxsize:int=1024, ttls:dict=None):
+        """Constructor method for the SQLite backed cache.
+
+        Arguments:
+            path {str} -- Path of the SQLite database file, created when missing
+
+        Keyword Arguments:
+            maxsize {int} -- Maximum amount of cached responses (default: {1024})
+            ttls {dict} -- Datablock name to time-to-live in seconds (default: {None})
+        """
+        super().__init__(maxsize, ttls)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS responses "
+                           "(key TEXT PRIMARY KEY, expires REAL, accessed REAL, data TEXT, stored REAL)")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(responses)")]
+        if "stored" not in columns:
+            # Databases of older versions lack the storage time, their entries count as cached when last used
+            self._conn.execute("ALTER TABLE responses ADD COLUMN stored REAL")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._conn.commit()
+
+    def get_entry(self, key:str):
+        """Returns the cached response for key and the time it was cached, or None if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT expires, data, coalesce(stored, accessed) FROM responses WHERE key = ?",
+                                     (key,)).fetchone()
+            if row is None or row[0] < now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[1]), row[2]
+
+    def set(self, key:str, data:dict):
+        """Caches a response, evicting the least recently used entries when the cache is full."""
+        now = time.time()
+        payload = data.text if isinstance(data, LazyForecast) else json.dumps(data)
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO responses (key, expires, accessed, data, stored) "
+                               "VALUES (?, ?, ?, ?, ?)", (key, now + self.ttl(data), now, payload, now))
+            overflow = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.maxsize
+            if overflow > 0:
+                self._conn.execute("DELETE FROM responses WHERE key IN "
+                                   "(SELECT key FROM responses ORDER BY accessed LIMIT ?)", (overflow,))
+                self.evictions += overflow
+                logger.debug("%s responses evicted from %s", overflow, self.path)
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
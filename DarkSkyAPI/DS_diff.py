@@ -0,0 +1,128 @@
+from DarkSkyAPI.constants import allowed_datablocks
+
+_series = ("minutely", "hourly", "daily")
+
+
+def _diff_point(old:dict, new:dict):
+    """Returns the changed and added fields of a datapoint and the names of the removed fields."""
+    diff = {}
+    changed = {k: v for k, v in new.items() if k not in old or old[k] != v}
+    if changed:
+        diff["changed"] = changed
+    removed = [k for k in old if k not in new]
+    if removed:
+        diff["removed"] = removed
+    return diff
+
+
+def _diff_block(old:dict, new:dict):
+    diff = {k: new.get(k) for k in ("summary", "icon") if old.get(k) != new.get(k)}
+    old_points = {point.get("time"): point for point in old.get("data", [])}
+    changed, added = {}, {}
+    for point in new.get("data", []):
+        t = point.get("time")
+        previous = old_points.pop(t, None)
+        if previous is None:
+            added[t] = point
+        elif previous != point:
+            changed[t] = _diff_point(previous, point)
+    if changed:
+        diff["changed"] = changed
+    if added:
+        diff["added"] = added
+    if old_points:
+        diff["removed"] = list(old_points)
+    return diff
+
+
+def diff_forecast(old, new):
+    """Compares two responses of the same location per datablock and, within a datablock, per datapoint time.
+
+    The diff only holds what changed:
+        currently -- {"changed": {field: new value}, "removed": [field]}
+        minutely, hourly and daily -- the new summary and icon when they changed and {"changed": {time: changes
+        of the datapoint in the form of currently}, "added": {time: datapoint}, "removed": [time]}
+        other keys (alerts, flags, offset, ...) -- {"value": new value}
+    Keys removed from the response have the value None. Empty parts and unchanged blocks are left out, so an
+    empty dict means nothing changed. Null values in the response are changes like any other value.
+
+    Arguments:
+        old {dict} -- The previous raw response, an empty dict for none
+        new {dict} -- The new raw response
+
+    Returns:
+        dict -- The changes per key of the response
+    """
+    diff = {}
+    for key in new:
+        if key not in old:
+            previous = {}
+        else:
+            previous = old[key]
+            if previous == new[key]:
+                continue
+        if key == "currently":
+            diff[key] = _diff_point(previous, new[key])
+        elif key in _series:
+            diff[key] = _diff_block(previous, new[key])
+        else:
+            diff[key] = {"value": new[key]}
+    for key in old:
+        if key not in new:
+            diff[key] = None
+    return diff
+
+
+def apply_diff(raw_data, diff:dict):
+    """Applies a diff made by diff_forecast to a copy of the old response.
+
+    Arguments:
+        raw_data {dict} -- The old raw response
+        diff {dict} -- The diff between the old and new response
+
+    Returns:
+        dict -- The new raw response, unchanged datablocks are shared with raw_data
+    """
+    result = dict(raw_data)
+    for key, change in diff.items():
+        if change is None:
+            result.pop(key, None)
+        elif key == "currently":
+            result[key] = _apply_point(result.get(key, {}), change)
+        elif key in _series:
+            result[key] = _apply_block(result.get(key, {}), change)
+        else:
+            result[key] = change["value"]
+    return result
+
+
+def _apply_point(point:dict, change:dict):
+    point = dict(point)
+    point.update(change.get("changed", {}))
+    for field in change.get("removed", ()):
+        point.pop(field, None)
+    return point
+
+
+def _apply_block(block:dict, change:dict):
+    block = dict(block)
+    for k in ("summary", "icon"):
+        if k in change:
+            block[k] = change[k]
+    removed = set(change.get("removed", ()))
+    changed = change.get("changed", {})
+    points = {}
+    for point in block.get("data", []):
+        t = point.get("time")
+        if t not in removed:
+            points[t] = _apply_point(point, changed[t]) if t in changed else point
+    points.update(change.get("added", {}))
+    block["data"] = sorted(points.values(), key=lambda point: point.get("time", 0))
+    return block
+
+
+def affected_blocks(diff:dict):
+    """Returns the datablocks whose DSF views are outdated by a diff, every block when the timezone changed."""
+    if "timezone" in diff:
+        return set(allowed_datablocks)
+    return {key for key in diff if key in allowed_datablocks}
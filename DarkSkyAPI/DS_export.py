@@ -0,0 +1,208 @@
+import csv
+import io
+import json
+import os
+from array import array
+from itertools import islice
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from DarkSkyAPI.DSForecast import timestamp, timestamps
+from DarkSkyAPI.constants import datapoint_fields
+
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+_string_fields = ("summary", "icon", "precipType")
+
+
+def _is_time(field:str):
+    return field.lower().find("time") >= 0
+
+
+def export_fields(block:str, fields:list=None):
+    """Returns the column names of an export: latitude, longitude, time and the selected datapoints."""
+    fields = [f for f in (fields or datapoint_fields[block]) if f != "time"]
+    return ["latitude", "longitude", "time"] + fields
+
+
+def iter_rows(forecasts, block:str, fields:list=None, date_fmt:str=ISO_FORMAT, tz:str=None):
+    """Generates one tuple per datapoint of a datablock of many forecasts.
+
+    Values are read straight from the datapoints of the response, or from the columns of a snapshot, so no view
+    or dict is made per datablock or datapoint. Missing values are None.
+
+    Arguments:
+        forecasts {iterable} -- DarkSkyClient instances or raw responses, consumed lazily
+        block {str} -- The datablock (example: hourly)
+
+    Keyword Arguments:
+        fields {list} -- Datapoints to export, all datapoints of the block when None (default: {None})
+        date_fmt {str} -- Format of time datapoints, unix timestamps when None (default: {ISO 8601})
+        tz {str} -- IANA timezone used to format times, the timezone of each forecast when None (default: {None})
+
+    Yields:
+        tuple -- latitude, longitude, time and the selected datapoints, see export_fields
+    """
+    names = export_fields(block, fields)[2:]
+    time_fields = [i for i, name in enumerate(names) if _is_time(name)] if date_fmt else []
+    for forecast in forecasts:
+        raw_data = getattr(forecast, "raw_data", forecast)
+        if block not in raw_data:
+            continue
+        data = raw_data[block]
+        rows = [data] if block == "currently" else data["data"]
+        zone = tz or raw_data.get("timezone")
+        location = (raw_data.get("latitude"), raw_data.get("longitude"))
+        stored = getattr(rows, "column", None)
+        if stored is not None:
+            # Columnar sources, such as snapshot files, are zipped from their stored columns
+            columns = []
+            for i, name in enumerate(names):
+                column, missing = stored(name)
+                if missing and isinstance(column, array):
+                    column = [None if v != v else v for v in column]
+                if i in time_fields:
+                    column = timestamps(column, date_fmt, zone)
+                columns.append(column)
+            n = len(rows)
+            yield from zip([location[0]] * n, [location[1]] * n, *columns)
+            continue
+        for row in rows:
+            values = list(map(row.get, names))
+            for i in time_fields:
+                if values[i] is not None:
+                    values[i] = timestamp(values[i], date_fmt, zone)
+            yield location + tuple(values)
+
+
+def iter_batches(rows, batch_size:int):
+    """Splits an iterable of rows into lists of at most batch_size rows."""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _open(sink, mode:str):
+    """Returns the file object of a sink and whether it was opened here."""
+    if isinstance(sink, (str, os.PathLike)):
+        return open(sink, mode), True
+    return sink, False
+
+
+def export_csv(forecasts, block:str, sink, fields:list=None, date_fmt:str=ISO_FORMAT, tz:str=None,
+               batch_size:int=10000):
+    """Streams a datablock of many forecasts to a CSV file with a header row. Missing values are empty.
+
+    Arguments:
+        forecasts {iterable} -- DarkSkyClient instances or raw responses, consumed lazily
+        block {str} -- The datablock (example: hourly)
+        sink {str} -- Path of the output file, or a binary file object with a write method
+
+    Keyword Arguments:
+        fields {list} -- Datapoints to export, see iter_rows (default: {None})
+        date_fmt {str} -- Format of time datapoints, see iter_rows (default: {ISO 8601})
+        tz {str} -- Timezone of the formatted times, see iter_rows (default: {None})
+        batch_size {int} -- Rows held in memory before they are written (default: {10000})
+
+    Returns:
+        int -- Amount of written rows
+    """
+    out, own_file = _open(sink, "wb")
+    # Every batch is formatted in memory and written with a single call
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(export_fields(block, fields))
+    count = 0
+    try:
+        for batch in iter_batches(iter_rows(forecasts, block, fields, date_fmt, tz), batch_size):
+            writer.writerows(batch)
+            out.write(text.getvalue().encode("utf-8"))
+            text.seek(0)
+            text.truncate()
+            count += len(batch)
+        if not count:
+            out.write(text.getvalue().encode("utf-8"))
+    finally:
+        if own_file:
+            out.close()
+    return count
+
+
+def export_ndjson(forecasts, block:str, sink, fields:list=None, date_fmt:str=ISO_FORMAT, tz:str=None,
+                  batch_size:int=10000):
+    """Streams a datablock of many forecasts to newline delimited JSON, one object per datapoint.
+
+    Takes the same arguments as export_csv. Missing values are null.
+
+    Returns:
+        int -- Amount of written rows
+    """
+    names = export_fields(block, fields)
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    out, own_file = _open(sink, "wb")
+    count = 0
+    try:
+        for batch in iter_batches(iter_rows(forecasts, block, fields, date_fmt, tz), batch_size):
+            lines = [encode(dict(zip(names, row))) for row in batch]
+            out.write(("\n".join(lines) + "\n").encode("utf-8"))
+            count += len(batch)
+    finally:
+        if own_file:
+            out.close()
+    return count
+
+
+def arrow_schema(block:str, fields:list=None, date_fmt:str=ISO_FORMAT):
+    """Returns the pyarrow schema of an export: strings for text and formatted times, float64 for the rest."""
+    if pa is None:
+        raise ImportError("pyarrow is required for Arrow and Parquet exports, install darkskyapi-py[arrow]")
+    columns = []
+    for name in export_fields(block, fields):
+        if name in _string_fields or (date_fmt and _is_time(name)):
+            columns.append(pa.field(name, pa.string()))
+        elif _is_time(name):
+            columns.append(pa.field(name, pa.int64()))
+        else:
+            columns.append(pa.field(name, pa.float64()))
+    return pa.schema(columns)
+
+
+def export_arrow(forecasts, block:str, sink, fields:list=None, date_fmt:str=ISO_FORMAT, tz:str=None,
+                 batch_size:int=10000, file_format:str="ipc"):
+    """Streams a datablock of many forecasts to an Arrow IPC file or a Parquet file, requires pyarrow.
+
+    Takes the same arguments as export_csv. Every batch becomes one record batch, or one row group for Parquet.
+
+    Keyword Arguments:
+        file_format {str} -- ipc or parquet (default: {ipc})
+
+    Returns:
+        int -- Amount of written rows
+    """
+    schema = arrow_schema(block, fields, date_fmt)
+    if file_format not in ("ipc", "parquet"):
+        raise ValueError(f"Unknown file format {file_format}, use ipc or parquet")
+    out, own_file = _open(sink, "wb")
+    writer = pq.ParquetWriter(out, schema) if file_format == "parquet" else pa.ipc.new_file(out, schema)
+    count = 0
+    try:
+        for batch in iter_batches(iter_rows(forecasts, block, fields, date_fmt, tz), batch_size):
+            arrays = [pa.array(column, type=field.type) for column, field in zip(zip(*batch), schema)]
+            record_batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+            if file_format == "parquet":
+                writer.write_batch(record_batch)
+            else:
+                writer.write(record_batch)
+            count += len(batch)
+    finally:
+        writer.close()
+        if own_file:
+            out.close()
+    return count
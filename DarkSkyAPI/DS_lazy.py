@@ -0,0 +1,101 @@
+import json
+import re
+from collections.abc import Mapping
+
+from DarkSkyAPI.constants import allowed_datablocks
+
+# Top-level keys of a forecast response. A quoted key directly followed by a colon can't occur inside a JSON
+# string, because the closing quote of a key would have to be escaped there.
+_top_level_keys = ["latitude", "longitude", "timezone"] + allowed_datablocks + ["offset"]
+_known_keys = frozenset(_top_level_keys)
+_colon = re.compile(r'\s*:\s*')
+_decoder = json.JSONDecoder()
+
+
+def _find_key(text:str, key:str, start:int, end:int=None):
+    """Returns the offset of the value of a quoted key in text[start:end], None if the key isn't found."""
+    needle = f'"{key}"'
+    index = text.find(needle, start, end)
+    while index >= 0:
+        match = _colon.match(text, index + len(needle))
+        if match:
+            return match.end()
+        index = text.find(needle, index + 1, end)
+    return None
+
+
+class LazyForecast(Mapping):
+
+    def __init__(self, text:str):
+        """Constructor method.
+
+        A read-only dict-like view of a raw forecast response which only locates the documented top-level keys
+        up front. Each of them is decoded from the raw text on first access, so blocks that are never read are
+        never materialized. Other top-level keys can't be located without parsing the whole text, so listing the
+        keys (iteration, len) or looking up an undocumented key decodes the whole response once.
+
+        Arguments:
+            text {str} -- The JSON body of a forecast response
+        """
+        self.text = text
+        self._decoded = {}
+        self._complete = False
+        offsets = []
+        position = 0
+        for key in _top_level_keys:
+            # Keys usually come in the documented order, so search onwards from the previous key first
+            offset = _find_key(text, key, position)
+            if offset is None and position:
+                offset = _find_key(text, key, 0, position)
+            if offset is not None:
+                offsets.append((offset, key))
+                position = max(position, offset)
+        self._offsets = {key: offset for offset, key in sorted(offsets)}
+
+    def _decode_all(self):
+        if self._complete:
+            return
+        decoded = json.loads(self.text)
+        # Blocks that were handed out already stay the same objects
+        self._decoded = {key: self._decoded.get(key, value) for key, value in decoded.items()}
+        self._complete = True
+
+    def __getitem__(self, key:str):
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        if self._complete:
+            raise KeyError(key)
+        if key not in self._offsets:
+            if key in _known_keys:
+                raise KeyError(key)
+            self._decode_all()
+            return self._decoded[key]
+        value, _ = _decoder.raw_decode(self.text, self._offsets[key])
+        self._decoded[key] = value
+        return value
+
+    def __contains__(self, key):
+        if key in self._decoded or key in self._offsets:
+            return True
+        if self._complete or key in _known_keys:
+            return False
+        self._decode_all()
+        return key in self._decoded
+
+    def __iter__(self):
+        self._decode_all()
+        return iter(self._decoded)
+
+    def __len__(self):
+        self._decode_all()
+        return len(self._decoded)
+
+    @property
+    def decoded(self):
+        """list: the keys that have been decoded so far."""
+        return list(self._decoded)
+
+    def __repr__(self):
+        return f"LazyForecast({list(self._offsets)}, decoded={self.decoded})"
@@ -1,9 +1,26 @@
 import logging
 
 logger = logging.getLogger(__name__)
-handler = logging.StreamHandler()
-formatter = logging.Formatter(
-    '[*] %(levelname)s - %(asctime)s - %(message)s'
-)
-handler.setFormatter(formatter)
-logger.addHandler(handler)
\ No newline at end of file
+logger.addHandler(logging.NullHandler())
+
+
+def enable_logging(level:int=logging.INFO):
+    """Attaches a stream handler to the package logger.
+
+    No handler is installed on import, so log records cost nothing unless the application configures logging
+    or calls this function. Messages are formatted lazily and only when the level is enabled.
+
+    Keyword Arguments:
+        level {int} -- Minimum level of the logged messages (default: {logging.INFO})
+
+    Returns:
+        logging.Handler -- The attached handler
+    """
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter(
+        '[*] %(levelname)s - %(asctime)s - %(message)s'
+    )
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return handler
@@ -0,0 +1,166 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from DarkSkyAPI.DS_logger import logger
+
+# Registered callbacks. Call sites check the list before building an event, so without hooks instrumentation
+# costs one truth test.
+hooks = []
+
+
+def add_hook(callback):
+    """Registers a callback(event, fields) for instrumentation events.
+
+    Events and their fields:
+        request -- url, status, seconds (until the response headers), download_seconds, bytes, server_seconds,
+                   api_calls
+        decode -- seconds, bytes, lazy
+        cache -- hit
+        view -- view, seconds
+        error -- phase, error, url
+
+    Arguments:
+        callback {callable} -- Called with the event name and a dict of fields
+    """
+    hooks.append(callback)
+
+
+def remove_hook(callback):
+    hooks.remove(callback)
+
+
+def emit(event:str, **fields):
+    for hook in list(hooks):
+        try:
+            hook(event, fields)
+        except Exception as e:
+            logger.error("Instrumentation hook %r failed: %r", hook, e)
+
+
+def _labels(labels:tuple):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+class Histogram:
+
+    def __init__(self, buckets:tuple):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value:float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+
+    seconds_buckets = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        """Constructor method.
+
+        A minimal metrics registry that turns instrumentation events into counters, gauges and histograms.
+        Register it with add_hook(registry) and export it with prometheus_text() or serve().
+        """
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+
+    def inc(self, name:str, value:float=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name:str, value:float, **labels):
+        with self._lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name:str, value:float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.seconds_buckets)
+            histogram.observe(value)
+
+    def __call__(self, event:str, fields:dict):
+        if event == "request":
+            self.inc("darksky_requests_total", status=fields["status"])
+            self.observe("darksky_request_seconds", fields["seconds"])
+            self.observe("darksky_download_seconds", fields["download_seconds"])
+            self.inc("darksky_response_bytes_total", fields["bytes"])
+            if fields.get("server_seconds") is not None:
+                self.observe("darksky_server_seconds", fields["server_seconds"])
+            if fields.get("api_calls") is not None:
+                self.set("darksky_api_calls", fields["api_calls"])
+        elif event == "decode":
+            self.observe("darksky_decode_seconds", fields["seconds"], lazy=str(fields["lazy"]).lower())
+        elif event == "cache":
+            self.inc("darksky_cache_lookups_total", result="hit" if fields["hit"] else "miss")
+        elif event == "view":
+            self.observe("darksky_view_seconds", fields["seconds"], view=fields["view"])
+        elif event == "error":
+            self.inc("darksky_errors_total", phase=fields["phase"], error=fields["error"])
+
+    def prometheus_text(self):
+        """Returns the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str -- The exposition text
+        """
+        lines = []
+        with self._lock:
+            for kind, metrics in (("counter", self.counters), ("gauge", self.gauges)):
+                for name in sorted({name for name, _ in metrics}):
+                    lines.append(f"# TYPE {name} {kind}")
+                    for (metric, labels), value in sorted(metrics.items()):
+                        if metric == name:
+                            lines.append(f"{name}{_labels(labels)} {value}")
+            for name in sorted({name for name, _ in self.histograms}):
+                lines.append(f"# TYPE {name} histogram")
+                for (metric, labels), histogram in sorted(self.histograms.items()):
+                    if metric != name:
+                        continue
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        lines.append(f"{name}_bucket{_labels(labels + (('le', bound),))} {count}")
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{name}_sum{_labels(labels)} {histogram.sum}")
+                    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port:int=9108, host:str="127.0.0.1"):
+        """Serves prometheus_text() on http://host:port/metrics from a daemon thread.
+
+        Keyword Arguments:
+            port {int} -- Port to listen on, 0 picks a free port (default: {9108})
+            host {str} -- Interface to listen on (default: {"127.0.0.1"})
+
+        Returns:
+            HTTPServer -- The running server, stop it with shutdown()
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                body = registry.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
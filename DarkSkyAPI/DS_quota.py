@@ -0,0 +1,137 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from DarkSkyAPI.DS_logger import logger
+
+
+class QuotaExceeded(Exception):
+    """Raised when a request would exceed the daily API call limit."""
+
+
+class QuotaLimiter:
+
+    def __init__(self, path:str, daily_limit:int=1000, rate:float=None, burst:int=1, block:bool=True,
+                 max_wait:float=None):
+        """Constructor method.
+
+        Shares the daily API call count and a token bucket between threads and processes through a SQLite file.
+        The DarkSky quota resets at midnight UTC.
+
+        Arguments:
+            path {str} -- Path of the SQLite database file, created when missing
+
+        Keyword Arguments:
+            daily_limit {int} -- Maximum amount of calls per UTC day (default: {1000})
+            rate {float} -- Maximum amount of calls per second, unlimited when None (default: {None})
+            burst {int} -- Maximum amount of calls that can be made at once when rate is set (default: {1})
+            block {bool} -- Wait for a token when the rate is exceeded instead of raising QuotaExceeded
+            (default: {True})
+            max_wait {float} -- Maximum seconds to wait for a token before raising QuotaExceeded (default: {None})
+        """
+        self.path = path
+        self.daily_limit = daily_limit
+        self.rate = rate
+        self.burst = burst
+        self.block = block
+        self.max_wait = max_wait
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS quota "
+                         "(day TEXT PRIMARY KEY, used INTEGER, tokens REAL, updated REAL, "
+                         "rejected INTEGER, waited REAL)")
+
+    def __getstate__(self):
+        # Connections can't be shared between processes, every process opens its own from path
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        return conn
+
+    @staticmethod
+    def _today():
+        return datetime.now(timezone.utc).date().isoformat()
+
+    def _transaction(self, func):
+        """Runs func(conn, row) inside an exclusive transaction on today's quota row."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            day = self._today()
+            row = conn.execute("SELECT used, tokens, updated, rejected, waited FROM quota WHERE day = ?",
+                               (day,)).fetchone()
+            if row is None:
+                row = (0, float(self.burst), time.time(), 0, 0.0)
+                conn.execute("INSERT INTO quota VALUES (?, ?, ?, ?, ?, ?)", (day,) + row)
+            result = func(conn, day, *row)
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def acquire(self):
+        """Takes one call from the quota, waiting for the rate limit if needed.
+
+        Raises:
+            QuotaExceeded -- When the daily limit is reached or no token is available in time
+        """
+        waited = 0.0
+        while True:
+            wait = self._transaction(self._take)
+            if wait is None:
+                raise QuotaExceeded(f"daily limit of {self.daily_limit} calls reached")
+            if wait == 0:
+                if waited:
+                    self._transaction(lambda conn, day, *row: conn.execute(
+                        "UPDATE quota SET waited = waited + ? WHERE day = ?", (waited, day)))
+                return
+            if not self.block or (self.max_wait is not None and waited + wait > self.max_wait):
+                self._transaction(self._reject)
+                raise QuotaExceeded(f"rate limit of {self.rate} calls per second reached")
+            time.sleep(wait)
+            waited += wait
+
+    def _take(self, conn, day, used, tokens, updated, rejected, waited):
+        """Returns 0 when a call was taken, the seconds to wait for a token or None when the day is used up."""
+        if used >= self.daily_limit:
+            self._reject(conn, day)
+            return None
+        now = time.time()
+        if self.rate:
+            tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                return (1 - tokens) / self.rate
+            tokens -= 1
+        conn.execute("UPDATE quota SET used = ?, tokens = ?, updated = ? WHERE day = ?",
+                     (used + 1, tokens, now, day))
+        return 0
+
+    def _reject(self, conn, day, *row):
+        conn.execute("UPDATE quota SET rejected = rejected + 1 WHERE day = ?", (day,))
+
+    def update(self, calls:int):
+        """Synchronizes the count with the X-Forecast-API-Calls header, the calls made today according to DarkSky.
+
+        Arguments:
+            calls {int} -- The value of the X-Forecast-API-Calls header
+        """
+        self._transaction(lambda conn, day, used, *row: conn.execute(
+            "UPDATE quota SET used = ? WHERE day = ?", (max(used, calls), day)))
+        logger.debug("API calls used today: %s", calls)
+
+    @property
+    def metrics(self):
+        """dict: calls used and remaining today, calls rejected and total seconds spent waiting for the rate limit."""
+        used, _, _, rejected, waited = self._transaction(lambda conn, day, *row: row)
+        return dict(used=used, remaining=max(self.daily_limit - used, 0), rejected=rejected, wait_time=waited)
@@ -0,0 +1,111 @@
+import sys
+from collections import namedtuple
+
+from DarkSkyAPI.constants import datapoint_fields
+
+_interned_fields = ("summary", "icon", "precipType")
+
+
+def _record_type(name:str, fields:list):
+    record = namedtuple(name, fields + ["extra"])
+    record.__doc__ = f"Compact record of a {name[:-6].lower()} datapoint. Unknown fields are kept in extra."
+    return record
+
+
+CurrentRecord = _record_type("CurrentRecord", datapoint_fields["currently"])
+MinutelyRecord = _record_type("MinutelyRecord", datapoint_fields["minutely"])
+HourlyRecord = _record_type("HourlyRecord", datapoint_fields["hourly"])
+DailyRecord = _record_type("DailyRecord", datapoint_fields["daily"])
+
+record_types = {
+    "currently": CurrentRecord,
+    "minutely": MinutelyRecord,
+    "hourly": HourlyRecord,
+    "daily": DailyRecord,
+}
+
+_known_fields = {block: frozenset(record._fields[:-1]) for block, record in record_types.items()}
+_interned_positions = {block: [(field, record._fields.index(field)) for field in _interned_fields
+                               if field in record._fields[:-1]] for block, record in record_types.items()}
+
+CompactBlock = namedtuple("CompactBlock", ["summary", "icon", "data"])
+
+
+def to_record(block:str, datapoint:dict):
+    """Converts a datapoint dict to the fixed-schema record of its datablock.
+
+    Summary, icon and precipType strings are interned so equal strings of many forecasts are stored once.
+
+    Arguments:
+        block {str} -- The datablock the datapoint belongs to (example: hourly)
+        datapoint {dict} -- A datapoint dict from the DarkSkyAPI
+
+    Returns:
+        tuple -- A CurrentRecord, MinutelyRecord, HourlyRecord or DailyRecord
+    """
+    record = record_types[block]
+    values = list(map(datapoint.get, record._fields[:-1]))
+    for field, index in _interned_positions[block]:
+        value = datapoint.get(field)
+        if isinstance(value, str):
+            values[index] = sys.intern(value)
+    extra = None
+    if len(datapoint) != len(values) - values.count(None):
+        known = _known_fields[block]
+        extra = {k: v for k, v in datapoint.items() if k not in known} or None
+    values.append(extra)
+    return record._make(values)
+
+
+def to_dict(record):
+    """Converts a record back to the datapoint dict it was made from."""
+    data = {k: v for k, v in zip(record._fields[:-1], record) if v is not None}
+    if record.extra:
+        data.update(record.extra)
+    return data
+
+
+class CompactForecast:
+
+    __slots__ = ("latitude", "longitude", "timezone", "offset", "currently", "minutely", "hourly", "daily")
+
+    def __init__(self, raw_data):
+        """Constructor method.
+
+        A memory-compact copy of a forecast response for keeping many forecasts in memory. Datapoints are stored as
+        tuple-backed records with attribute access instead of dicts. Alerts and flags are not kept.
+
+        Arguments:
+            raw_data {dict} -- A raw DarkSky response (example: client.raw_data)
+        """
+        self.latitude = raw_data.get("latitude")
+        self.longitude = raw_data.get("longitude")
+        self.timezone = raw_data.get("timezone")
+        self.offset = raw_data.get("offset")
+        self.currently = to_record("currently", raw_data["currently"]) if "currently" in raw_data else None
+        for block in ("minutely", "hourly", "daily"):
+            if block in raw_data:
+                data = raw_data[block]
+                records = tuple(to_record(block, datapoint) for datapoint in data["data"])
+                setattr(self, block, CompactBlock(data.get("summary"), data.get("icon"), records))
+            else:
+                setattr(self, block, None)
+
+    def to_raw(self):
+        """Rebuilds a raw response dict, for example to create DSF views.
+
+        Returns:
+            dict -- The response without alerts and flags
+        """
+        raw = dict(latitude=self.latitude, longitude=self.longitude, timezone=self.timezone, offset=self.offset)
+        if self.currently is not None:
+            raw["currently"] = to_dict(self.currently)
+        for block in ("minutely", "hourly", "daily"):
+            compact = getattr(self, block)
+            if compact is not None:
+                raw[block] = dict(summary=compact.summary, icon=compact.icon,
+                                  data=[to_dict(record) for record in compact.data])
+        return raw
+
+    def __repr__(self):
+        return f"CompactForecast({self.latitude}, {self.longitude}, {self.timezone})"
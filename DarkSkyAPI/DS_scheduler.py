@@ -0,0 +1,163 @@
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_logger import logger
+from DarkSkyAPI.constants import allowed_datablocks
+
+# Seconds between refreshes of each datablock. Alerts and flags come along with every request.
+DEFAULT_INTERVALS = {
+    "currently": 300,
+    "minutely": 300,
+    "hourly": 3600,
+    "daily": 6 * 3600,
+}
+
+
+class ForecastScheduler:
+
+    def __init__(self, api_key:str, locations:list, intervals:dict=None, max_workers:int=8, jitter:float=0.1,
+                 client_cls=DarkSkyClient, **kwargs):
+        """Constructor method.
+
+        Keeps the forecasts of a set of locations up to date, refreshing every datablock on its own interval.
+        Each request excludes the datablocks that aren't due and the fetched datablocks are merged into the
+        forecast of the location, after which the subscribers are called.
+
+        Arguments:
+            api_key {str} -- The DarkSky API key
+            locations {list} -- A list of (latitude, longitude) tuples
+
+        Keyword Arguments:
+            intervals {dict} -- Datablock name to refresh interval in seconds, merged over DEFAULT_INTERVALS.
+            Datablocks set to None are never requested (default: {None})
+            max_workers {int} -- Maximum amount of requests in flight (default: {8})
+            jitter {float} -- Random fraction added to or taken from every interval to spread requests
+            (default: {0.1})
+            client_cls {type} -- Client class used for the requests (default: {DarkSkyClient})
+            kwargs -- Any other keyword argument accepted by the client constructor (example: units, lang)
+        """
+        self.api_key = api_key
+        self.intervals = {block: interval for block, interval in dict(DEFAULT_INTERVALS, **(intervals or {})).items()
+                          if interval is not None}
+        self.max_workers = max_workers
+        self.jitter = jitter
+        self.kwargs = kwargs
+        self.clients = {tuple(location): client_cls(api_key, tuple(location), lazy=True, **kwargs)
+                        for location in locations}
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._executor = None
+        now = time.time()
+        # Spread the first requests of all locations over the jitter window
+        self._due = [(now + random.uniform(0, self.jitter * min(self.intervals.values())), location, block)
+                     for location in self.clients for block in self.intervals]
+        heapq.heapify(self._due)
+
+    def subscribe(self, callback):
+        """Registers a callback(location, blocks, client) called after the datablocks of a location are refreshed.
+
+        The client holds the merged forecast, so its currently, daily, hourly and minutely views are up to date.
+        Callbacks run on the worker threads.
+        """
+        self._subscribers.append(callback)
+
+    def _next_due(self, block:str):
+        interval = self.intervals[block]
+        return time.time() + interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _refresh(self, location:tuple, blocks:list):
+        client = self.clients[location]
+        exclude = [block for block in allowed_datablocks if block not in blocks and block not in ("alerts", "flags")]
+        fetcher = type(client)(self.api_key, location, exclude=exclude, lazy=True, **self.kwargs)
+        data = fetcher.raw_data
+        with self._lock:
+            # Only the datablocks that weren't requested are kept from the previous forecast. Keys that come with
+            # every response (alerts, flags, offset, ...) are replaced, or removed when absent, like an expired alert.
+            old = client._raw_data or {}
+            merged = {key: old[key] for key in DEFAULT_INTERVALS if key in old and key not in blocks}
+            merged.update(data)
+            client.raw_data = merged
+            client.url = fetcher.url
+            for block in blocks:
+                heapq.heappush(self._due, (self._next_due(block), location, block))
+        for callback in self._subscribers:
+            try:
+                callback(location, blocks, client)
+            except Exception as e:
+                logger.error("Subscriber %r failed for %s: %r", callback, location, e)
+
+    def run_pending(self):
+        """Refreshes every location with due datablocks and waits for the requests to finish.
+
+        Returns:
+            int -- Amount of requests made
+        """
+        now = time.time()
+        due = {}
+        with self._lock:
+            while self._due and self._due[0][0] <= now:
+                _, location, block = heapq.heappop(self._due)
+                due.setdefault(location, []).append(block)
+            if due:
+                # Take along datablocks of the same locations that would be due within the jitter window
+                window = now + self.jitter * min(self.intervals.values())
+                remaining = []
+                for entry in self._due:
+                    if entry[1] in due and entry[0] <= window:
+                        due[entry[1]].append(entry[2])
+                    else:
+                        remaining.append(entry)
+                heapq.heapify(remaining)
+                self._due = remaining
+        if due and self._executor is None:
+            # Created on first use and again after stop(), so a stopped scheduler can be started again
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {self._executor.submit(self._refresh, location, blocks): (location, blocks)
+                   for location, blocks in due.items()}
+        wait(futures)
+        for future, (location, blocks) in futures.items():
+            if future.exception() is not None:
+                logger.error("Refresh of %s for %s failed: %r", blocks, location, future.exception())
+                with self._lock:
+                    # Retry the failed datablocks after a tenth of their interval
+                    for block in blocks:
+                        heapq.heappush(self._due, (time.time() + self.intervals[block] / 10, location, block))
+        return len(futures)
+
+    def seconds_until_due(self):
+        """float: seconds until the next datablock is due, 0 when one is overdue."""
+        with self._lock:
+            return max(self._due[0][0] - time.time(), 0) if self._due else float('inf')
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                # A failed round must not end the thread, the next round retries what is due
+                logger.error("Scheduler round failed: %r", e)
+                self._stop.wait(1)
+            self._stop.wait(min(self.seconds_until_due(), 60))
+
+    def start(self):
+        """Starts refreshing in a background thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="ForecastScheduler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout:float=None):
+        """Stops the background thread after the current round of requests, start() resumes refreshing."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,57 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 10)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_shared_session = None
+_lock = threading.Lock()
+
+
+def build_session(retries:int=3, backoff_factor:float=0.5, pool_maxsize:int=64):
+    """Creates a keep-alive session with a connection pool and a retry policy.
+
+    Keyword Arguments:
+        retries {int} -- Amount of retries on connection errors and 429/5xx responses (default: {3})
+        backoff_factor {float} -- Exponential backoff factor between retries in seconds (default: {0.5})
+        pool_maxsize {int} -- Maximum amount of pooled connections per host (default: {64})
+
+    Returns:
+        requests.Session -- The configured session
+    """
+    retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=RETRY_STATUSES,
+                  respect_retry_after_header=True, raise_on_status=False)
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """Returns the process-wide session, creating it on first use.
+
+    Returns:
+        requests.Session -- The shared session
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _lock:
+            if _shared_session is None:
+                _shared_session = build_session()
+    return _shared_session
+
+
+def set_session(session):
+    """Replaces the process-wide session used by clients that weren't given their own.
+
+    Arguments:
+        session {requests.Session} -- The new shared session
+    """
+    global _shared_session
+    with _lock:
+        _shared_session = session
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+
+
+def snap(value:float, grid:float):
+    """Rounds a coordinate to the nearest multiple of grid, so nearby points share one request.
+
+    Arguments:
+        value {float} -- Latitude or longitude
+        grid {float} -- Grid size in degrees (example: 0.01)
+
+    Returns:
+        float -- The snapped coordinate
+    """
+    return round(round(value / grid) * grid, 6)
+
+
+class _Call:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+
+    def __init__(self):
+        """Constructor method.
+
+        Deduplicates concurrent calls for the same key between threads: the first caller runs the function and
+        every caller that arrives while it runs waits for and shares its result or exception.
+
+        Attributes:
+            calls {int} -- Amount of times a function was actually run
+            shared {int} -- Amount of callers that reused the result of a call in flight
+        """
+        self.calls = 0
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def do(self, key, func):
+        """Runs func() unless a call for key is already in flight, in which case its result is returned.
+
+        Arguments:
+            key {str} -- The deduplication key (example: the request url)
+            func {callable} -- Function without arguments
+
+        Returns:
+            object -- The return value of func
+        """
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+
+    def __init__(self):
+        """Constructor method.
+
+        The asyncio counterpart of SingleFlight, deduplicating concurrent coroutines of one event loop.
+
+        Attributes:
+            calls {int} -- Amount of times a coroutine was actually awaited
+            shared {int} -- Amount of callers that reused the result of a call in flight
+        """
+        self.calls = 0
+        self.shared = 0
+        self._in_flight = {}
+
+    async def do(self, key, func):
+        """Awaits func() unless a call for key is already in flight, in which case its result is returned.
+
+        Arguments:
+            key {str} -- The deduplication key (example: the request url)
+            func {callable} -- Coroutine function without arguments
+
+        Returns:
+            object -- The return value of func
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.shared += 1
+            return await asyncio.shield(future)
+        future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        self.calls += 1
+        try:
+            result = await func()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, the leader re-raises it
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
@@ -0,0 +1,332 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+
+MAGIC = b"DSSNAP01"
+_trailer = struct.Struct("<QQ8s")
+_no_string = 0xFFFFFFFF
+_blocks = ("currently", "minutely", "hourly", "daily")
+
+# Column types: complete integer columns, numeric columns with NaN for missing values (flagged when the values
+# were integers), indices into the string table and a JSON fallback for everything else
+INT, FLOAT, STRING, JSON = "q", "d", "s", "j"
+IS_INT, MISSING = 1, 2
+
+
+def _to_bytes(values:array):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode:str, buffer):
+    values = array(typecode)
+    values.frombytes(buffer)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+class SnapshotWriter:
+
+    def __init__(self, path:str):
+        """Constructor method.
+
+        Writes forecast responses to a snapshot file. Every datablock is stored as one binary column per
+        datapoint and all strings are stored once in a string table shared by the whole file. Reading a forecast
+        back gives equal values, absent fields stay absent and explicit nulls stay None. Integers in a column that
+        also holds floats come back as floats.
+
+        Arguments:
+            path {str} -- Path of the snapshot file, overwritten when it exists
+        """
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._fields = {}
+        self._strings = {}
+        self._forecasts = []
+
+    def _field(self, name:str):
+        return self._fields.setdefault(name, len(self._fields))
+
+    def _string(self, value:str):
+        return self._strings.setdefault(value, len(self._strings))
+
+    def _write(self, data:bytes):
+        # Columns start at 8-byte boundaries so the reader can cast them in place
+        position = self._file.tell()
+        padding = -position % 8
+        if padding:
+            self._file.write(b"\0" * padding)
+            position += padding
+        self._file.write(data)
+        return position
+
+    def _column(self, rows:list, field:str):
+        values = [row.get(field) for row in rows]
+        types = set(map(type, values))
+        types.discard(type(None))
+        flags = MISSING if None in values else 0
+        # Explicit nulls are told apart from absent fields by their row numbers, they are rare
+        nulls = [i for i, row in enumerate(rows) if field in row and row[field] is None] if flags else []
+        if types == {int} and not flags:
+            kind, data = INT, _to_bytes(array("q", values))
+        elif types and types <= {int, float}:
+            kind = FLOAT
+            flags |= IS_INT if types == {int} else 0
+            data = _to_bytes(array("d", [float("nan") if v is None else v for v in values]))
+        elif types == {str}:
+            kind = STRING
+            data = _to_bytes(array("I", [_no_string if v is None else self._string(v) for v in values]))
+        else:
+            return [self._field(field), JSON, values, flags] + ([nulls] if nulls else [])
+        return [self._field(field), kind, self._write(data), flags] + ([nulls] if nulls else [])
+
+    def _block(self, block:str, data):
+        rows = [data] if block == "currently" else data.get("data", [])
+        fields = {}
+        for row in rows:
+            fields.update(dict.fromkeys(row))
+        meta = {"rows": len(rows), "columns": [self._column(rows, field) for field in fields]}
+        if block != "currently":
+            meta.update({k: self._string(data[k]) for k in ("summary", "icon") if k in data})
+        return meta
+
+    def write(self, raw_data):
+        """Appends a forecast response.
+
+        Arguments:
+            raw_data {dict} -- A raw DarkSky response (example: client.raw_data)
+        """
+        meta = {"blocks": {}, "other": {}}
+        for key in raw_data:
+            if key in _blocks:
+                meta["blocks"][key] = self._block(key, raw_data[key])
+            else:
+                meta["other"][key] = raw_data[key]
+        data = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        self._forecasts.append((self._write(data), len(data)))
+
+    def close(self):
+        """Writes the field dictionary, string table and forecast index and closes the file."""
+        if self._file.closed:
+            return
+        footer = {"fields": list(self._fields), "strings": list(self._strings), "forecasts": self._forecasts}
+        data = json.dumps(footer, separators=(",", ":")).encode("utf-8")
+        offset = self._write(data)
+        self._file.write(_trailer.pack(offset, len(data), MAGIC))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_snapshot(path:str, forecasts):
+    """Writes forecast responses to a snapshot file.
+
+    Arguments:
+        path {str} -- Path of the snapshot file
+        forecasts {iterable} -- Raw DarkSky responses
+
+    Returns:
+        int -- Amount of written forecasts
+    """
+    count = 0
+    with SnapshotWriter(path) as writer:
+        for raw_data in forecasts:
+            writer.write(raw_data)
+            count += 1
+    return count
+
+
+class SnapshotRows(Sequence):
+
+    def __init__(self, snapshot, meta:dict):
+        """Constructor method.
+
+        The data list of a datablock in a snapshot. Rows are built from the memory-mapped columns when they are
+        indexed and DSF views read whole columns through column().
+        """
+        self._snapshot = snapshot
+        self._rows = meta["rows"]
+        self._columns = {}
+        self._sparse = []
+        for field, kind, position, flags, *nulls in meta["columns"]:
+            name = snapshot.fields[field]
+            if flags & MISSING or kind == JSON:
+                self._sparse.append((name, frozenset(nulls[0]) if nulls else ()))
+            if kind == JSON:
+                self._columns[name] = (kind, position, flags, None)
+                continue
+            size = 4 if kind == STRING else 8
+            raw = snapshot.buffer[position:position + size * self._rows]
+            self._columns[name] = (kind, raw.cast("I" if kind == STRING else kind), flags, raw)
+
+    def __len__(self):
+        return self._rows
+
+    def _value(self, kind:str, values, flags:int, index:int):
+        value = values[index]
+        if kind == FLOAT:
+            if value != value:
+                return None
+            return int(value) if flags & IS_INT else value
+        if kind == STRING:
+            return self._snapshot.strings[value] if value != _no_string else None
+        return value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._rows))]
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError("snapshot row index out of range")
+        strings = self._snapshot.strings
+        value = self._value
+        # Complete columns are read directly, the values of sparse columns are dropped again when missing
+        row = {name: value(kind, values, flags, index) if flags & MISSING or kind == JSON
+               else strings[values[index]] if kind == STRING else values[index]
+               for name, (kind, values, flags, _) in self._columns.items()}
+        for name, nulls in self._sparse:
+            if row[name] is None and index not in nulls:
+                del row[name]
+        return row
+
+    def column(self, datapoint:str):
+        """Returns a datapoint column in the form of DSForecast.to_column, copying only this column.
+
+        Returns:
+            tuple -- The column and a boolean which is True when values are missing
+        """
+        kind, values, flags, raw = self._columns.get(datapoint, (JSON, [None] * self._rows, 0, None))
+        if kind == INT:
+            return _from_bytes("q", raw), False
+        if kind == FLOAT:
+            column = _from_bytes("d", raw)
+            missing = bool(flags & MISSING)
+            if flags & IS_INT:
+                return [None if v != v else int(v) for v in column], missing
+            return column, missing
+        if kind == STRING:
+            strings = self._snapshot.strings
+            column = [strings[v] if v != _no_string else None for v in values]
+            return column, None in column
+        return list(values), None in values
+
+
+class SnapshotForecast(Mapping):
+
+    def __init__(self, snapshot, meta:dict):
+        """Constructor method.
+
+        A read-only dict-like forecast response backed by a snapshot file, usable as client.raw_data.
+        """
+        self._snapshot = snapshot
+        self._meta = meta
+        self._blocks = {}
+
+    def __getitem__(self, key:str):
+        meta = self._meta["blocks"].get(key)
+        if meta is None:
+            return self._meta["other"][key]
+        block = self._blocks.get(key)
+        if block is None:
+            rows = SnapshotRows(self._snapshot, meta)
+            if key == "currently":
+                block = rows[0]
+            else:
+                block = {k: self._snapshot.strings[meta[k]] for k in ("summary", "icon") if k in meta}
+                block["data"] = rows
+            self._blocks[key] = block
+        return block
+
+    def __contains__(self, key):
+        return key in self._meta["blocks"] or key in self._meta["other"]
+
+    def __iter__(self):
+        yield from self._meta["other"]
+        yield from self._meta["blocks"]
+
+    def __len__(self):
+        return len(self._meta["other"]) + len(self._meta["blocks"])
+
+    def __repr__(self):
+        return f"SnapshotForecast({list(self)})"
+
+
+class Snapshot(Sequence):
+
+    def __init__(self, path:str):
+        """Constructor method.
+
+        Memory-maps a snapshot file. Only the small footer is read when the file is opened; forecasts are indexed
+        like a list and their columns are read from the mapping on access.
+
+        Arguments:
+            path {str} -- Path of a file written by SnapshotWriter
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self._mmap)
+        if self.buffer[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a forecast snapshot")
+        offset, length, magic = _trailer.unpack_from(self.buffer, len(self.buffer) - _trailer.size)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+        footer = json.loads(bytes(self.buffer[offset:offset + length]))
+        self.fields = footer["fields"]
+        self.strings = [sys.intern(s) for s in footer["strings"]]
+        self._forecasts = footer["forecasts"]
+
+    def __len__(self):
+        return len(self._forecasts)
+
+    def __getitem__(self, index:int):
+        offset, length = self._forecasts[index]
+        return SnapshotForecast(self, json.loads(bytes(self.buffer[offset:offset + length])))
+
+    def client(self, index:int, api_key:str=None, client_cls=DarkSkyClient, **kwargs):
+        """Returns a lazy client holding a forecast of the snapshot, DSF views are built from its columns.
+
+        Arguments:
+            index {int} -- Index of the forecast
+
+        Keyword Arguments:
+            api_key {str} -- API key used when the client is refreshed (default: {None})
+            client_cls {type} -- Client class (default: {DarkSkyClient})
+            kwargs -- Any other keyword argument accepted by the client constructor
+        """
+        forecast = self[index]
+        client = client_cls(api_key, (forecast["latitude"], forecast["longitude"]), lazy=True, **kwargs)
+        client.raw_data = forecast
+        return client
+
+    def close(self):
+        """Closes the snapshot, the file is unmapped once no forecast read from it is referenced anymore."""
+        self.buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Forecasts still reference the mapping, it is unmapped when they are collected
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
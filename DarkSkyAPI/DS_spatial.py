@@ -0,0 +1,215 @@
+import math
+import threading
+import time
+from collections import namedtuple
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+SpatialEntry = namedtuple("SpatialEntry", ["latitude", "longitude", "raw_data", "fetched_at"])
+
+# Datapoints that can't be averaged, the value of the nearest site is used
+_not_interpolated = {"time", "windBearing", "nearestStormBearing", "uvIndex"}
+
+
+def haversine(lat1:float, lon1:float, lat2:float, lon2:float):
+    """Returns the great-circle distance between two coordinates in kilometers."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((phi2 - phi1) / 2) ** 2 + \
+        math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class SpatialIndex:
+
+    def __init__(self, cell_size:float=0.05):
+        """Constructor method.
+
+        A grid index of fetched forecasts. Points are bucketed into cells of cell_size degrees, so a radius search
+        only looks at the cells that overlap the radius.
+
+        Keyword Arguments:
+            cell_size {float} -- Cell size in degrees, about the typical search radius works best (default: {0.05})
+        """
+        self.cell_size = cell_size
+        self._cells = {}
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def _cell(self, lat:float, lon:float):
+        return int(math.floor(lat / self.cell_size)), int(math.floor(lon / self.cell_size))
+
+    def insert(self, lat:float, lon:float, raw_data, fetched_at:float=None):
+        """Adds a forecast, replacing an earlier forecast of the same coordinates."""
+        entry = SpatialEntry(lat, lon, raw_data, fetched_at or time.time())
+        with self._lock:
+            cell = self._cells.setdefault(self._cell(lat, lon), {})
+            if (lat, lon) not in cell:
+                self._size += 1
+            cell[(lat, lon)] = entry
+
+    def nearest(self, lat:float, lon:float, radius_km:float, max_age:float=None, k:int=1):
+        """Returns up to k forecasts within radius_km, nearest first.
+
+        Arguments:
+            lat {float} -- Latitude
+            lon {float} -- Longitude
+            radius_km {float} -- Search radius in kilometers
+
+        Keyword Arguments:
+            max_age {float} -- Ignore forecasts fetched longer than max_age seconds ago (default: {None})
+            k {int} -- Maximum amount of forecasts (default: {1})
+
+        Returns:
+            list -- (distance in km, SpatialEntry) tuples
+        """
+        dlat = radius_km / KM_PER_DEGREE
+        dlon = dlat / max(math.cos(math.radians(min(abs(lat) + dlat, 89.9))), 1e-6)
+        lat_lo, lon_lo = self._cell(lat - dlat, lon - dlon)
+        lat_hi, lon_hi = self._cell(lat + dlat, lon + dlon)
+        oldest = time.time() - max_age if max_age is not None else None
+        found = []
+        with self._lock:
+            for i in range(lat_lo, lat_hi + 1):
+                for j in range(lon_lo, lon_hi + 1):
+                    cell = self._cells.get((i, j))
+                    if not cell:
+                        continue
+                    for entry in cell.values():
+                        if oldest is not None and entry.fetched_at < oldest:
+                            continue
+                        distance = haversine(lat, lon, entry.latitude, entry.longitude)
+                        if distance <= radius_km:
+                            found.append((distance, entry))
+        found.sort(key=lambda item: item[0])
+        return found[:k]
+
+    def prune(self, max_age:float):
+        """Removes forecasts fetched longer than max_age seconds ago.
+
+        Returns:
+            int -- Amount of removed forecasts
+        """
+        oldest = time.time() - max_age
+        removed = 0
+        with self._lock:
+            for key in list(self._cells):
+                cell = self._cells[key]
+                for point in [p for p, entry in cell.items() if entry.fetched_at < oldest]:
+                    del cell[point]
+                    removed += 1
+                if not cell:
+                    del self._cells[key]
+            self._size -= removed
+        return removed
+
+    def __len__(self):
+        return self._size
+
+
+def interpolate(neighbours:list):
+    """Inverse distance weighted average of the numeric datapoints of several forecasts.
+
+    Datablocks are combined point by point when the times of the points are equal. Non-numeric datapoints,
+    bearings and times are taken from the nearest forecast.
+
+    Arguments:
+        neighbours {list} -- (distance in km, SpatialEntry) tuples, nearest first
+
+    Returns:
+        dict -- A raw response based on the nearest forecast
+    """
+    nearest = neighbours[0][1].raw_data
+    if neighbours[0][0] == 0 or len(neighbours) == 1:
+        return nearest
+    weights = [1 / distance ** 2 for distance, _ in neighbours]
+    raws = [entry.raw_data for _, entry in neighbours]
+
+    def blend(points:list):
+        point = dict(points[0])
+        for field, value in points[0].items():
+            if field in _not_interpolated or field.endswith("Time") or not isinstance(value, (int, float)):
+                continue
+            values = [p.get(field) for p in points]
+            if all(isinstance(v, (int, float)) for v in values):
+                point[field] = sum(w * v for w, v in zip(weights, values)) / sum(weights)
+        return point
+
+    raw = dict(nearest)
+    if "currently" in nearest and all("currently" in r for r in raws):
+        raw["currently"] = blend([r["currently"] for r in raws])
+    for block in ("minutely", "hourly", "daily"):
+        if block not in nearest or not all(block in r for r in raws):
+            continue
+        columns = [r[block]["data"] for r in raws]
+        data = []
+        for i, point in enumerate(columns[0]):
+            points = [c[i] for c in columns if i < len(c) and c[i].get("time") == point.get("time")]
+            data.append(blend(points) if len(points) == len(columns) else point)
+        raw[block] = dict(nearest[block], data=data)
+    return raw
+
+
+class SpatialForecastCache:
+
+    def __init__(self, api_key:str, radius_km:float=1.0, max_age:float=600, k:int=1, client_cls=DarkSkyClient,
+                 **kwargs):
+        """Constructor method.
+
+        Answers forecast requests from the nearest already fetched forecast within radius_km and max_age and only
+        requests a forecast when there is none.
+
+        Arguments:
+            api_key {str} -- The DarkSky API key
+
+        Keyword Arguments:
+            radius_km {float} -- Maximum distance to a fetched forecast in kilometers (default: {1.0})
+            max_age {float} -- Maximum age of a fetched forecast in seconds (default: {600})
+            k {int} -- Amount of nearby forecasts to interpolate numeric datapoints from, 1 disables
+            interpolation (default: {1})
+            client_cls {type} -- Client class used for the requests (default: {DarkSkyClient})
+            kwargs -- Any other keyword argument accepted by the client constructor
+
+        Attributes:
+            avoided {int} -- Requests answered from nearby forecasts
+            fetched {int} -- Requests sent to DarkSky
+        """
+        self.api_key = api_key
+        self.radius_km = radius_km
+        self.max_age = max_age
+        self.k = k
+        self.client_cls = client_cls
+        self.kwargs = kwargs
+        self.index = SpatialIndex(cell_size=max(radius_km / KM_PER_DEGREE, 1e-4))
+        self.avoided = 0
+        self.fetched = 0
+
+    def get(self, location:tuple):
+        """Returns a client for location, filled from a nearby forecast when possible.
+
+        Arguments:
+            location {tuple} -- A (latitude, longitude) tuple
+
+        Returns:
+            DarkSkyClient -- A client holding the forecast
+        """
+        lat, lon = location
+        client = self.client_cls(self.api_key, (lat, lon), lazy=True, **self.kwargs)
+        neighbours = self.index.nearest(lat, lon, self.radius_km, self.max_age, self.k)
+        if neighbours:
+            self.avoided += 1
+            client.raw_data = interpolate(neighbours) if self.k > 1 else neighbours[0][1].raw_data
+            # The setter stamps the data as fetched now, it is as old as the oldest forecast it was made from
+            client.fetched_at = min(entry.fetched_at for _, entry in neighbours)
+        else:
+            raw_data = client.raw_data
+            self.fetched += 1
+            self.index.insert(lat, lon, raw_data, client.fetched_at)
+        return client
+
+    @property
+    def stats(self):
+        """dict: requests avoided and fetched, and the amount of indexed forecasts."""
+        return dict(avoided=self.avoided, fetched=self.fetched, indexed=len(self.index))
@@ -0,0 +1,156 @@
+import sqlite3
+import threading
+from collections import defaultdict
+
+from DarkSkyAPI.DSForecast import timestamps
+
+_blocks = ("minutely", "hourly", "daily")
+
+
+class ForecastStore:
+
+    def __init__(self, path:str):
+        """Constructor method.
+
+        A SQLite store of forecast datapoints indexed by location, datablock, datapoint and time. Queries return
+        the shapes of DSFMBase.data_pair(graph=True) and DSFMBase.data_combined without decoding any JSON.
+
+        Arguments:
+            path {str} -- Path of the SQLite database file, created when missing (":memory:" for a temporary store)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sites (
+                lat REAL, lon REAL, timezone TEXT, PRIMARY KEY (lat, lon)
+            );
+            CREATE TABLE IF NOT EXISTS points (
+                block TEXT, field TEXT, time INTEGER, lat REAL, lon REAL, value,
+                PRIMARY KEY (block, field, time, lat, lon)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS points_location ON points (lat, lon, block, time);
+        """)
+
+    @staticmethod
+    def _rows(raw_data):
+        lat, lon = round(raw_data["latitude"], 4), round(raw_data["longitude"], 4)
+        for block in _blocks:
+            if block not in raw_data:
+                continue
+            for datapoint in raw_data[block]["data"]:
+                t = datapoint["time"]
+                for field, value in datapoint.items():
+                    if field != "time":
+                        yield block, field, t, lat, lon, value
+        if "currently" in raw_data:
+            currently = raw_data["currently"]
+            for field, value in currently.items():
+                if field != "time":
+                    yield "currently", field, currently["time"], lat, lon, value
+
+    def ingest(self, forecasts:list):
+        """Stores the datapoints of many forecasts in one transaction.
+
+        Newer values replace stored values of the same location, datablock, datapoint and time.
+
+        Arguments:
+            forecasts {list} -- DarkSkyClient instances or raw responses
+        """
+        with self._lock, self._conn:
+            for forecast in forecasts:
+                raw_data = getattr(forecast, "raw_data", forecast)
+                self._conn.execute("INSERT OR REPLACE INTO sites VALUES (?, ?, ?)",
+                                   (round(raw_data["latitude"], 4), round(raw_data["longitude"], 4),
+                                    raw_data.get("timezone")))
+                self._conn.executemany("INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?, ?, ?)",
+                                       self._rows(raw_data))
+
+    def locations(self):
+        """list: the (latitude, longitude) tuples of all stored sites."""
+        with self._lock:
+            return [tuple(row) for row in self._conn.execute("SELECT lat, lon FROM sites ORDER BY lat, lon")]
+
+    def _timezone(self, location:tuple):
+        row = self._conn.execute("SELECT timezone FROM sites WHERE lat = ? AND lon = ?",
+                                 (round(location[0], 4), round(location[1], 4))).fetchone()
+        return row[0] if row else None
+
+    def data_pair(self, block:str, datapoint:str, start:int=None, end:int=None, date_fmt:str="%d-%m-%Y %H:%M"):
+        """Returns the values of one datapoint for all sites between start and end.
+
+        Arguments:
+            block {str} -- The datablock (example: hourly)
+            datapoint {str} -- The forecast datapoint (example: windSpeed)
+
+        Keyword Arguments:
+            start {int} -- First UNIX time, inclusive (default: {None})
+            end {int} -- Last UNIX time, inclusive (default: {None})
+            date_fmt {str} -- The datetime format, applied in the timezone of each site (default: {"%d-%m-%Y %H:%M"})
+
+        Returns:
+            dict -- (latitude, longitude) tuples mapped to graph-friendly dicts like DSFMBase.data_pair(graph=True)
+        """
+        query = "SELECT lat, lon, time, value FROM points WHERE block = ? AND field = ?"
+        params = [block, datapoint]
+        if start is not None:
+            query += " AND time >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND time <= ?"
+            params.append(end)
+        series = defaultdict(lambda: dict(x=[], y=[]))
+        with self._lock:
+            for lat, lon, t, value in self._conn.execute(query + " ORDER BY time", params):
+                pair = series[(lat, lon)]
+                pair["x"].append(t)
+                pair["y"].append(value)
+            for location, pair in series.items():
+                pair["x"] = timestamps(pair["x"], date_fmt, self._timezone(location))
+        return dict(series)
+
+    def data_combined(self, location:tuple, block:str, datalist:list, start:int=None, end:int=None,
+                      date_fmt:str="%d-%m-%Y %H:%M"):
+        """Returns the values of several datapoints of one site between start and end.
+
+        Arguments:
+            location {tuple} -- A (latitude, longitude) tuple
+            block {str} -- The datablock (example: hourly)
+            datalist {list} -- A list of datapoints you want the values of
+
+        Keyword Arguments:
+            start {int} -- First UNIX time, inclusive (default: {None})
+            end {int} -- Last UNIX time, inclusive (default: {None})
+            date_fmt {str} -- Datetime format of time datapoints (default: {"%d-%m-%Y %H:%M"})
+
+        Returns:
+            dict -- A dict of datapoints and their corresponding values like DSFMBase.data_combined
+        """
+        lat, lon = round(location[0], 4), round(location[1], 4)
+        query = "SELECT time, field, value FROM points WHERE lat = ? AND lon = ? AND block = ?"
+        params = [lat, lon, block]
+        if start is not None:
+            query += " AND time >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND time <= ?"
+            params.append(end)
+        rows = defaultdict(dict)
+        with self._lock:
+            for t, field, value in self._conn.execute(query, params):
+                rows[t][field] = value
+            tz = self._timezone(location)
+        times = sorted(rows)
+        combined = {}
+        for datapoint in datalist:
+            if datapoint == "time":
+                values = times
+            else:
+                values = [rows[t].get(datapoint) for t in times]
+            if datapoint.lower().find("time") >= 0:
+                values = timestamps(values, date_fmt, tz)
+            combined[datapoint] = values
+        return combined
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,106 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DSForecast import timestamps
+from DarkSkyAPI.DS_logger import logger
+
+_series_blocks = ("minutely", "hourly", "daily")
+
+
+def to_record(client, blocks:tuple, fields:list=None, date_fmt:str="%Y-%m-%dT%H:%M:%S%z"):
+    """Flattens the views of a client into a JSON-serializable dict of columns.
+
+    Arguments:
+        client {DarkSkyClient} -- A client holding a forecast
+        blocks {tuple} -- The datablocks to include
+
+    Keyword Arguments:
+        fields {list} -- Datapoints to include, all datapoints when None (default: {None})
+        date_fmt {str} -- Format of time datapoints, in the timezone of the forecast (default: {ISO 8601})
+
+    Returns:
+        dict -- location, timezone, currently as a dict and every datapoint of the other datablocks as columns
+        in the form of data_combined
+    """
+    record = dict(location=list(client.location), timezone=client.timezone)
+    for block in blocks:
+        if block not in client.raw_data:
+            continue
+        if block == "currently":
+            currently = client.raw_data["currently"]
+            record[block] = {k: v for k, v in currently.items() if fields is None or k in fields or k == "time"}
+        elif block in _series_blocks:
+            view = getattr(client, block)
+            # The datapoints of all rows, a datapoint can be missing from the first ones (example: precipType)
+            datalist = ["time"] + [f for f in (fields or list(view.columns)) if f != "time"]
+            # Every datapoint of the block, data_combined stops at the default range of the view
+            record[block] = {f: timestamps(view.column(f), date_fmt, view.timezone)
+                             if f.lower().find("time") >= 0 else view.column(f) for f in datalist}
+    return record
+
+
+def _sweep_shard(api_key:str, shard:list, blocks:tuple, fields:list, max_workers:int, client_cls, kwargs:dict):
+    """Runs in a worker process: fetches a shard concurrently and returns it as newline delimited JSON bytes."""
+    exclude = [block for block in ("currently",) + _series_blocks if block not in blocks]
+    lines = []
+    errors = 0
+    for location, client, error in client_cls.fetch_many(api_key, shard, exclude=exclude or None,
+                                                        max_workers=max_workers, **kwargs):
+        if error is not None:
+            errors += 1
+            record = dict(location=list(location), error=repr(error))
+        else:
+            record = to_record(client, blocks, fields)
+        lines.append(json.dumps(record, separators=(",", ":")))
+    payload = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+    return payload, len(shard), errors
+
+
+def sweep(api_key:str, locations:list, sink, processes:int=None, shard_size:int=50, max_workers:int=8,
+          blocks:tuple=("currently", "hourly", "daily"), fields:list=None, client_cls=DarkSkyClient, **kwargs):
+    """Fetches and flattens the forecasts of many locations on a pool of processes.
+
+    The locations are split into shards. Every worker process fetches a shard with fetch_many and turns the
+    forecasts into compact records (see to_record). Only the encoded records travel back, as newline delimited
+    JSON bytes, and they are written to the sink as each shard finishes.
+
+    Arguments:
+        api_key {str} -- The DarkSky API key
+        locations {list} -- A list of (latitude, longitude) tuples
+        sink {str} -- Path of the output file, or a binary file object with a write method
+
+    Keyword Arguments:
+        processes {int} -- Amount of worker processes (default: {os.cpu_count()})
+        shard_size {int} -- Locations per shard (default: {50})
+        max_workers {int} -- Concurrent requests per process (default: {8})
+        blocks {tuple} -- Datablocks to request and include (default: {("currently", "hourly", "daily")})
+        fields {list} -- Datapoints to include, all when None (default: {None})
+        client_cls {type} -- Client class used for the requests, must be importable by the workers
+        (default: {DarkSkyClient})
+        kwargs -- Any other keyword argument accepted by the client constructor, must be picklable
+
+    Returns:
+        dict -- Amount of locations, errors and bytes written
+    """
+    locations = [tuple(location) for location in locations]
+    shards = [locations[i:i + shard_size] for i in range(0, len(locations), shard_size)]
+    own_file = isinstance(sink, (str, os.PathLike))
+    out = open(sink, "wb") if own_file else sink
+    stats = dict(locations=0, errors=0, bytes=0)
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_sweep_shard, api_key, shard, tuple(blocks), fields, max_workers, client_cls,
+                                       kwargs) for shard in shards]
+            for future in as_completed(futures):
+                payload, count, errors = future.result()
+                out.write(payload)
+                stats["locations"] += count
+                stats["errors"] += errors
+                stats["bytes"] += len(payload)
+                logger.debug("Sweep shard of %s locations written", count)
+    finally:
+        if own_file:
+            out.close()
+    return stats
@@ -1,17 +1,32 @@
-import requests
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from DarkSkyAPI.DSForecast import DSFCurrent, DSFDaily, DSFHourly, DSFMinutely
+from DarkSkyAPI.DS_cache import response_ttl
+from DarkSkyAPI.DS_diff import affected_blocks, diff_forecast
+from DarkSkyAPI.DS_lazy import LazyForecast
 from DarkSkyAPI.DS_logger import logger
+from DarkSkyAPI.DS_metrics import emit, hooks
+from DarkSkyAPI.DS_records import CompactForecast
+from DarkSkyAPI.DS_session import DEFAULT_TIMEOUT, get_session
+from DarkSkyAPI.DS_singleflight import snap
 from DarkSkyAPI.constants import allowed_datablocks, allowed_langs
 
 # TODO:: Add docstrings
 
+FetchResult = namedtuple("FetchResult", ["location", "client", "error"])
+
+
 class DarkSkyClient:
 
     base_url = "https://api.darksky.net/forecast/{}/{},{}?units={}"
+    time_machine_url = "https://api.darksky.net/forecast/{}/{},{},{}?units={}"
     API_calls_remaining = 1000
 
-    def __init__(self, api_key:str, location:tuple, units:str="si", exclude:list=None, lang=None):
+    def __init__(self, api_key:str, location:tuple, units:str="si", exclude:list=None, lang=None,
+                 session=None, timeout=DEFAULT_TIMEOUT, cache=None, lazy:bool=False,
+                 lazy_decode:bool=False, time=None, quota=None, singleflight=None, grid:float=None):
         self.api_key = api_key
         self._location = location
         self._latitude = None
@@ -19,12 +34,62 @@ class DarkSkyClient:
         self.units = units
         self.exclude = exclude
         self.lang = lang
+        self.time = time
+        self.quota = quota
+        self.singleflight = singleflight
+        self.grid = grid
         self.url = None
-        self.raw_data = self._get_response()
-        self.timezone = self.raw_data['timezone']
+        self.session = session
+        self.timeout = timeout
+        self.cache = cache
+        self.lazy_decode = lazy_decode
+        self._raw_data = None
+        self._views = {}
+        self._subscribers = []
+        self.fetched_at = None
+        if not lazy:
+            self.refresh()
+
+    @classmethod
+    def fetch_many(cls, api_key:str, locations:list, units:str="si", exclude:list=None, lang=None,
+                   max_workers:int=8, **kwargs):
+        """Fetches the forecasts of many locations concurrently using a bounded pool of worker threads.
+
+        Arguments:
+            api_key {str} -- The DarkSky API key
+            locations {list} -- A list of (latitude, longitude) tuples
+
+        Keyword Arguments:
+            units {str} -- Units of every request (default: {"si"})
+            exclude {list} -- Datablocks to exclude from every request (default: {None})
+            lang {str} -- Language of the summaries (default: {None})
+            max_workers {int} -- Maximum amount of requests in flight (default: {8})
+            kwargs -- Any other keyword argument accepted by the client constructor
+
+        Yields:
+            FetchResult -- (location, client, error) tuples in order of completion. Either client or error is None.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(cls, api_key, location, units, exclude, lang, **kwargs): location
+                       for location in locations}
+            try:
+                for future in as_completed(futures):
+                    location = futures[future]
+                    try:
+                        client, error = future.result(), None
+                    except Exception as e:
+                        logger.error("Request for %s failed: %r", location, e)
+                        client, error = None, e
+                    yield FetchResult(location, client, error)
+            finally:
+                for future in futures:
+                    future.cancel()
 
     def _url_builder(self):
-        url = self.base_url.format(self.api_key, self.latitude, self.longitude, self.units)
+        if self.time is None:
+            url = self.base_url.format(self.api_key, self.latitude, self.longitude, self.units)
+        else:
+            url = self.time_machine_url.format(self.api_key, self.latitude, self.longitude, self.time, self.units)
         if self.exclude:
             for e in self.exclude:
                 if e not in allowed_datablocks:
@@ -32,27 +97,205 @@ class DarkSkyClient:
             url += f"&exclude={(',').join(self.exclude)}"
         if self.lang and self.lang in allowed_langs:
             url += f"&lang={self.lang}"
-        logger.debug(f"url set: {url}")
+        logger.debug("url set: %s", url)
         self.url = url
         return url
 
-    def _get_response(self):
-        raw_response = requests.get(self._url_builder())
-        self.API_calls_remaining -= int(raw_response.headers['X-Forecast-API-Calls'])
-        logger.info(f"API calls remaining: {self.API_calls_remaining}")
-        return raw_response.json()
+    @property
+    def cache_key(self):
+        """str: the request normalized to rounded coordinates, units, sorted exclusions, language and time."""
+        exclude = ",".join(sorted(self.exclude)) if self.exclude else ""
+        return f"{round(self.latitude, 4)},{round(self.longitude, 4)}|{self.units}|{exclude}|{self.lang or ''}" \
+               f"|{self.time if self.time is not None else ''}"
+
+    def _get_response(self, force:bool=False):
+        """Returns the response and the time it was fetched, from the cache unless force is set."""
+        url = self._url_builder()
+        if self.cache is not None and not force:
+            entry = self.cache.get_entry(self.cache_key)
+            if hooks:
+                emit("cache", hit=entry is not None)
+            if entry is not None:
+                logger.debug("cache hit: %s", url)
+                return entry
+        if self.singleflight is not None:
+            data = self.singleflight.do(url, lambda: self._fetch(url))
+        else:
+            data = self._fetch(url)
+        return data, time.time()
+
+    def _fetch(self, url:str):
+        if self.quota is not None:
+            self.quota.acquire()
+        session = self.session or get_session()
+        start = time.perf_counter()
+        try:
+            raw_response = session.get(url, timeout=self.timeout)
+            raw_response.raise_for_status()
+        except Exception as e:
+            if hooks:
+                emit("error", phase="request", error=type(e).__name__, url=url)
+            raise
+        if hooks:
+            elapsed = raw_response.elapsed.total_seconds()
+            self._emit_request(url, raw_response.status_code, raw_response.headers, elapsed,
+                               max(time.perf_counter() - start - elapsed, 0.0), len(raw_response.content))
+        self._count_api_calls(raw_response.headers)
+        start = time.perf_counter()
+        try:
+            if self.lazy_decode:
+                data = LazyForecast(raw_response.content.decode('utf-8'))
+            else:
+                data = raw_response.json()
+        except ValueError as e:
+            if hooks:
+                emit("error", phase="decode", error=type(e).__name__, url=url)
+            raise
+        if hooks:
+            emit("decode", seconds=time.perf_counter() - start, bytes=len(raw_response.content),
+                 lazy=self.lazy_decode)
+        if self.cache is not None:
+            self.cache.set(self.cache_key, data)
+        return data
+
+    @staticmethod
+    def _emit_request(url:str, status:int, headers, seconds:float, download_seconds:float, size:int):
+        # DarkSky reports its own processing time as for example "X-Response-Time: 52.123ms"
+        server_time = headers.get('X-Response-Time', '')
+        try:
+            server_seconds = float(server_time.rstrip('ms')) / 1000 if server_time else None
+        except ValueError:
+            server_seconds = None
+        emit("request", url=url, status=status, seconds=seconds, download_seconds=download_seconds, bytes=size,
+             server_seconds=server_seconds, api_calls=int(headers.get('X-Forecast-API-Calls', 0)) or None)
+
+    def _count_api_calls(self, headers):
+        self.API_calls_remaining -= int(headers['X-Forecast-API-Calls'])
+        if self.quota is not None:
+            self.quota.update(int(headers['X-Forecast-API-Calls']))
+        logger.info("API calls remaining: %s", self.API_calls_remaining)
+
+    def is_stale(self, max_age:float=None):
+        """Checks whether the forecast has to be (re)fetched.
+
+        Keyword Arguments:
+            max_age {float} -- Maximum age of the data in seconds. Defaults to the TTL of the shortest lived
+            datablock in the response, historical (Time Machine) data never goes stale by default (default: {None})
+
+        Returns:
+            bool -- True when there is no data yet or it is older than max_age
+        """
+        if self._raw_data is None:
+            return True
+        if max_age is None and self.time is not None:
+            return False
+        if max_age is None:
+            max_age = response_ttl(self._raw_data)
+        return time.time() - self.fetched_at > max_age
+
+    def refresh(self, max_age:float=None, force:bool=False):
+        """Fetches the forecast when it is stale.
+
+        Keyword Arguments:
+            max_age {float} -- Maximum age of the data in seconds, see is_stale (default: {None})
+            force {bool} -- Request the forecast regardless of the age of the data, bypassing the cache
+            (default: {False})
+
+        Returns:
+            bool -- True when the forecast was fetched
+        """
+        if not force and not self.is_stale(max_age):
+            return False
+        self._store(*self._get_response(force))
+        return True
+
+    def refresh_incremental(self, max_age:float=None, force:bool=False):
+        """Fetches the forecast when it is stale and only invalidates the views of the datablocks that changed.
+
+        The new response is compared to the previous one per datablock and per datapoint time, see
+        DS_diff.diff_forecast. Subscribers are called with the diff when anything changed.
+
+        Keyword Arguments:
+            max_age {float} -- Maximum age of the data in seconds, see is_stale (default: {None})
+            force {bool} -- Request the forecast regardless of the age of the data, bypassing the cache
+            (default: {False})
+
+        Returns:
+            dict -- The diff, empty when nothing changed or nothing was fetched
+        """
+        if not force and not self.is_stale(max_age):
+            return {}
+        return self._apply_incremental(*self._get_response(force))
+
+    def _store(self, data:dict, fetched_at:float):
+        """Stores a response with the time it was fetched, which is older than now for cached responses."""
+        self.raw_data = data
+        self.fetched_at = fetched_at
+
+    def _apply_incremental(self, data:dict, fetched_at:float):
+        """Stores a new response, drops the views of changed datablocks and calls the subscribers."""
+        previous = self._raw_data
+        diff = diff_forecast(previous if previous is not None else {}, data)
+        self._raw_data = data
+        self.fetched_at = fetched_at
+        blocks = affected_blocks(diff)
+        self._views = {key: view for key, view in self._views.items() if key[0] not in blocks}
+        if diff:
+            for callback in self._subscribers:
+                try:
+                    callback(self, diff)
+                except Exception as e:
+                    logger.error("Subscriber %r failed for %r: %r", callback, self, e)
+        return diff
+
+    def subscribe(self, callback):
+        """Registers a callback(client, diff) called when refresh_incremental finds changes."""
+        self._subscribers.append(callback)
+
+    @property
+    def raw_data(self):
+        """dict: the raw response, fetched on first access when the client is lazy."""
+        if self._raw_data is None:
+            self.refresh()
+        return self._raw_data
+
+    @raw_data.setter
+    def raw_data(self, value:dict):
+        self._raw_data = value
+        self._views = {}
+        self.fetched_at = time.time() if value is not None else None
+
+    @property
+    def timezone(self):
+        return self.raw_data['timezone']
+
+    def _view(self, view_cls, block:str, *args):
+        """Returns the DSF view of a datablock, built once per fetched response."""
+        data = self.raw_data[block]
+        key = (block,) + args
+        view = self._views.get(key)
+        if view is None:
+            start = time.perf_counter()
+            view = self._views[key] = view_cls(data, *args, tz=self.timezone)
+            if hooks:
+                emit("view", view=view_cls.__name__, seconds=time.perf_counter() - start)
+        return view
 
     def get_current(self):
-        return DSFCurrent(self.raw_data['currently'])
+        return self._view(DSFCurrent, 'currently')
 
     def get_daily(self, days:int=7):
-        return DSFDaily(self.raw_data['daily'], days)
+        return self._view(DSFDaily, 'daily', days)
 
     def get_hourly(self, hours:int=47):
-        return DSFHourly(self.raw_data['hourly'], hours)
+        return self._view(DSFHourly, 'hourly', hours)
 
     def get_minutely(self, minutes:int=60):
-        return DSFMinutely(self.raw_data['minutely'], minutes)
+        return self._view(DSFMinutely, 'minutely', minutes)
+
+    def compact(self):
+        """Returns a memory-compact copy of the forecast, see DS_records.CompactForecast."""
+        return CompactForecast(self.raw_data)
 
     def has_currently(self):
         return "currently" in self.raw_data
@@ -100,6 +343,8 @@ class DarkSkyClient:
 
     @property
     def latitude(self):
+        if self.grid:
+            return snap(self._location[0], self.grid)
         return self._location[0]
 
     @latitude.setter
@@ -108,6 +353,8 @@ class DarkSkyClient:
 
     @property
     def longitude(self):
+        if self.grid:
+            return snap(self._location[1], self.grid)
         return self._location[1]
 
     @longitude.setter
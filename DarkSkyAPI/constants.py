@@ -49,4 +49,32 @@ allowed_langs = [
     "x-pig-latin",
     "zh",
     "zh-tw",
-]
\ No newline at end of file
+]
+
+# Known datapoint fields of each datablock, in the order of the DarkSky documentation
+datapoint_fields = {
+    "currently": [
+        "time", "summary", "icon", "nearestStormDistance", "nearestStormBearing", "precipIntensity",
+        "precipIntensityError", "precipProbability", "precipType", "temperature", "apparentTemperature",
+        "dewPoint", "humidity", "pressure", "windSpeed", "windGust", "windBearing", "cloudCover", "uvIndex",
+        "visibility", "ozone",
+    ],
+    "minutely": [
+        "time", "precipIntensity", "precipIntensityError", "precipProbability", "precipType",
+    ],
+    "hourly": [
+        "time", "summary", "icon", "precipIntensity", "precipIntensityError", "precipProbability", "precipType",
+        "precipAccumulation", "temperature", "apparentTemperature", "dewPoint", "humidity", "pressure",
+        "windSpeed", "windGust", "windBearing", "cloudCover", "uvIndex", "visibility", "ozone",
+    ],
+    "daily": [
+        "time", "summary", "icon", "sunriseTime", "sunsetTime", "moonPhase", "precipIntensity",
+        "precipIntensityError", "precipIntensityMax", "precipIntensityMaxTime", "precipProbability",
+        "precipAccumulation", "precipType", "temperatureHigh", "temperatureHighTime", "temperatureLow",
+        "temperatureLowTime", "apparentTemperatureHigh", "apparentTemperatureHighTime", "apparentTemperatureLow",
+        "apparentTemperatureLowTime", "dewPoint", "humidity", "pressure", "windSpeed", "windGust", "windGustTime",
+        "windBearing", "cloudCover", "uvIndex", "uvIndexTime", "visibility", "ozone", "temperatureMin",
+        "temperatureMinTime", "temperatureMax", "temperatureMaxTime", "apparentTemperatureMin",
+        "apparentTemperatureMinTime", "apparentTemperatureMax", "apparentTemperatureMaxTime",
+    ],
+}
@@ -0,0 +1,70 @@
+"""Offline benchmark suite of the wrapper's hot paths against the recorded fixture and the local stub server.
+
+Run from the repository root:
+    python -m benchmarks --save results.json
+    python -m benchmarks --compare results.json
+"""
+import argparse
+import json
+import sys
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DSForecast import DSFCurrent, DSFDaily, DSFHourly, DSFMinutely, timestamp
+from benchmarks.harness import Case, compare, run, save
+from benchmarks.stub_server import StubServer, load_fixture
+
+
+def cases(server:StubServer):
+    payload = load_fixture()
+    raw_data = json.loads(payload)
+    client_cls = server.client_class(DarkSkyClient)
+    client = client_cls("key", (52.37, 4.89))
+    hourly = DSFHourly(raw_data['hourly'], 47, tz=raw_data['timezone'])
+    daily = DSFDaily(raw_data['daily'], 7, tz=raw_data['timezone'])
+
+    def fresh_hourly():
+        return DSFHourly(raw_data['hourly'], 47, tz=raw_data['timezone'])
+
+    return [
+        Case("client construction (stub http)", lambda: client_cls("key", (52.37, 4.89)), number=10),
+        Case("client construction (lazy)", lambda: client_cls("key", (52.37, 4.89), lazy=True), number=1000),
+        Case("_get_response (stub http)", client._get_response, number=10),
+        Case("json decode", lambda: json.loads(payload), number=20),
+        Case("DSFCurrent construction", lambda: DSFCurrent(raw_data['currently']), number=1000),
+        Case("DSFDaily construction", lambda: DSFDaily(raw_data['daily'], 7), number=1000),
+        Case("DSFHourly construction", fresh_hourly, number=1000),
+        Case("DSFMinutely construction", lambda: DSFMinutely(raw_data['minutely'], 60), number=1000),
+        Case("data_single cold", lambda: fresh_hourly().data_single('windSpeed'), number=200),
+        Case("data_single warm", lambda: hourly.data_single('windSpeed'), number=1000),
+        Case("data_single to_percent", lambda: hourly.data_single('humidity', to_percent=True), number=1000),
+        Case("data_pair", lambda: hourly.data_pair('temperature'), number=1000),
+        Case("data_pair graph", lambda: hourly.data_pair('temperature', graph=True), number=1000),
+        Case("data_combined all", lambda: hourly.data_combined(), number=200),
+        Case("data_combined list", lambda: daily.data_combined(['time', 'temperatureHigh', 'sunriseTime']),
+             number=1000),
+        Case("datetimes", lambda: hourly.datetimes(), number=1000),
+        Case("timestamp cached", lambda: timestamp(raw_data['currently']['time'], "%d-%m-%Y %H:%M"), number=10000),
+        Case("timestamp uncached", lambda: timestamp.__wrapped__(raw_data['currently']['time'], "%d-%m-%Y %H:%M",
+                                                                 raw_data['timezone']), number=10000),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare with results saved earlier")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative p50 slowdown reported as a regression (default: 0.1)")
+    args = parser.parse_args()
+    with StubServer() as server:
+        results = run(cases(server), args.filter)
+    if args.save:
+        save(results, args.save)
+    if args.compare:
+        if compare(results, args.compare, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
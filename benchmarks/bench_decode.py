@@ -0,0 +1,46 @@
+"""Decoding a recorded forecast with json.loads versus LazyForecast when only some datablocks are read.
+
+Run from the repository root:
+    python -m benchmarks.bench_decode
+"""
+import argparse
+import json
+import timeit
+import tracemalloc
+
+from DarkSkyAPI.DS_lazy import LazyForecast
+from benchmarks.stub_server import load_fixture
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def read(forecast, *blocks):
+    return [forecast[block] for block in blocks]
+
+
+def run(number:int):
+    text = load_fixture().decode('utf-8')
+    cases = (
+        ("json.loads", lambda: json.loads(text)['currently']),
+        ("lazy, currently", lambda: LazyForecast(text)['currently']),
+        ("lazy, currently + daily", lambda: read(LazyForecast(text), 'currently', 'daily')),
+        ("lazy, every block", lambda: dict(LazyForecast(text))),
+    )
+    print(f"{len(text)} byte response, {number} iterations")
+    print(f"{'case':>24} {'us/response':>12} {'peak KiB':>9}")
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:>24} {seconds / number * 1e6:>12.1f} {peak_memory(func) / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    run(parser.parse_args().number)
@@ -0,0 +1,100 @@
+"""Throughput and peak memory of the streaming exporters on many recorded responses.
+
+Each case decodes the recorded response once per forecast (with shifted coordinates) and exports its hourly block.
+data_combined is the old approach: a client, a DSFHourly view and data_combined per forecast, written with
+csv.writer. Every case runs in a fresh interpreter, so the peak RSS belongs to that case alone.
+
+Run from the repository root:
+    python -m benchmarks.bench_export --responses 10000
+"""
+import argparse
+import csv
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI import DS_export
+from DarkSkyAPI.DS_export import ISO_FORMAT, export_arrow, export_csv, export_fields, export_ndjson
+from benchmarks.stub_server import load_fixture
+
+
+def responses(count:int):
+    text = load_fixture().decode("utf-8")
+    for i in range(count):
+        raw = json.loads(text)
+        raw["latitude"] = round(50 + i * 0.001, 4)
+        yield raw
+
+
+def data_combined(forecasts, block:str, sink:str):
+    fields = export_fields(block)
+    count = 0
+    with open(sink, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(fields)
+        for raw in forecasts:
+            client = DarkSkyClient(None, (raw["latitude"], raw["longitude"]), lazy=True)
+            client.raw_data = raw
+            view = client.hourly
+            columns = view.data_combined(fields[2:], ISO_FORMAT)
+            n = len(columns["time"])
+            writer.writerows(zip([client.latitude] * n, [client.longitude] * n, *columns.values()))
+            count += n
+    return count
+
+
+def decode_only(forecasts, block:str, sink:str):
+    return sum(len(raw[block]["data"]) for raw in forecasts)
+
+
+cases = {
+    "decode only": decode_only,
+    "data_combined": data_combined,
+    "csv": export_csv,
+    "ndjson": export_ndjson,
+    "arrow ipc": export_arrow,
+    "parquet": lambda forecasts, block, sink: export_arrow(forecasts, block, sink, file_format="parquet"),
+}
+
+
+def measure(case:str, count:int, sink:str):
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    rows = cases[case](responses(count), "hourly", sink)
+    seconds = time.perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    print(json.dumps(dict(rows=rows, seconds=seconds, rss_kib=rss)))
+
+
+def run(count:int):
+    names = [name for name in cases if DS_export.pa is not None or name not in ("arrow ipc", "parquet")]
+    print(f"{count} responses, hourly block, all datapoints")
+    print(f"{'case':>14} {'rows':>8} {'seconds':>8} {'rows/s':>9} {'MiB out':>8} {'peak RSS MiB':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in names:
+            sink = os.path.join(tmp, "export")
+            output = subprocess.run([sys.executable, "-m", "benchmarks.bench_export", "--responses", str(count),
+                                     "--case", name, "--sink", sink], check=True, capture_output=True, text=True)
+            result = json.loads(output.stdout)
+            size = os.path.getsize(sink) / 2 ** 20 if os.path.exists(sink) else 0
+            print(f"{name:>14} {result['rows']:>8} {result['seconds']:>8.2f} "
+                  f"{result['rows'] / result['seconds']:>9.0f} {size:>8.1f} {result['rss_kib'] / 1024:>13.1f}")
+            if os.path.exists(sink):
+                os.remove(sink)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--responses", type=int, default=10000)
+    parser.add_argument("--case", choices=list(cases), help=argparse.SUPPRESS)
+    parser.add_argument("--sink", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.case:
+        measure(args.case, args.responses, args.sink)
+    else:
+        run(args.responses)
@@ -0,0 +1,32 @@
+"""Throughput of DarkSkyClient.fetch_many against the local stub server for increasing concurrency limits.
+
+Run from the repository root:
+    python -m benchmarks.bench_fetch_many
+"""
+import argparse
+import time
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from benchmarks.stub_server import StubServer
+
+
+def run(locations:int, latency:float, workers:list):
+    with StubServer(latency=latency) as server:
+        client_cls = server.client_class(DarkSkyClient)
+        grid = [(50 + i * 0.01, 4 + i * 0.01) for i in range(locations)]
+        print(f"{locations} locations, {latency * 1000:.0f} ms server latency")
+        print(f"{'workers':>8} {'seconds':>9} {'req/s':>9} {'errors':>7}")
+        for n in workers:
+            start = time.perf_counter()
+            errors = sum(1 for result in client_cls.fetch_many("key", grid, max_workers=n) if result.error)
+            elapsed = time.perf_counter() - start
+            print(f"{n:>8} {elapsed:>9.3f} {locations / elapsed:>9.1f} {errors:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locations", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+    run(args.locations, args.latency, args.workers)
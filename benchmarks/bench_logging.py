@@ -0,0 +1,52 @@
+"""Cost of DSF accessors with logging disabled, enabled, and with eagerly formatted f-string messages.
+
+Run from the repository root:
+    python -m benchmarks.bench_logging
+"""
+import argparse
+import io
+import json
+import logging
+import timeit
+
+from DarkSkyAPI.DSForecast import DSFHourly, get_time_range
+from DarkSkyAPI.DS_logger import logger
+from benchmarks.stub_server import load_fixture
+
+
+def run(number:int):
+    hourly = json.loads(load_fixture())['hourly']
+
+    view = DSFHourly(hourly, 47)
+
+    def accessors():
+        view.temperature
+        view.humidity
+
+    def eager_messages():
+        # What the accessors paid before: messages formatted whether or not the level was enabled
+        view.temperature
+        f"{get_time_range(view, 47)} created for {repr(view)}"
+        view.humidity
+        f"{get_time_range(view, 47)} created for {repr(view)}"
+
+    def measure(func):
+        return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+    print(f"hourly.temperature + hourly.humidity, {number} iterations")
+    print(f"{'logging disabled':>28} {measure(accessors):>9.1f} us/iteration")
+    print(f"{'eager f-string messages':>28} {measure(eager_messages):>9.1f} us/iteration")
+    handler = logging.StreamHandler(io.StringIO())
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        print(f"{'logging enabled (INFO)':>28} {measure(accessors):>9.1f} us/iteration")
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    run(parser.parse_args().number)
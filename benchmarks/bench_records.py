@@ -0,0 +1,44 @@
+"""Memory of many forecasts kept as decoded JSON dicts versus CompactForecast records.
+
+Run from the repository root:
+    python -m benchmarks.bench_records --forecasts 10000
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from DarkSkyAPI.DS_records import CompactForecast
+from benchmarks.stub_server import load_fixture
+
+
+def measure(build, forecasts:int):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = [build() for _ in range(forecasts)]
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size, elapsed
+
+
+def run(forecasts:int):
+    text = load_fixture().decode('utf-8')
+    cases = (
+        ("raw dicts", lambda: json.loads(text)),
+        ("CompactForecast", lambda: CompactForecast(json.loads(text))),
+    )
+    print(f"{forecasts} forecasts kept in memory")
+    print(f"{'storage':>16} {'MiB':>9} {'KiB/forecast':>13} {'seconds':>8}")
+    for name, build in cases:
+        size, elapsed = measure(build, forecasts)
+        print(f"{name:>16} {size / 2 ** 20:>9.1f} {size / forecasts / 1024:>13.1f} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--forecasts", type=int, default=10000)
+    run(parser.parse_args().forecasts)
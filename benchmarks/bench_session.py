@@ -0,0 +1,47 @@
+"""Per-request latency of DarkSkyClient with a fresh connection per request versus the pooled keep-alive session.
+
+Run from the repository root:
+    python -m benchmarks.bench_session
+"""
+import argparse
+import statistics
+import time
+
+import requests
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_session import build_session
+from benchmarks.stub_server import StubServer
+
+
+class UnpooledSession:
+    """Mimics the old module-level requests.get: a new connection for every request."""
+
+    def get(self, url, **kwargs):
+        return requests.get(url, **kwargs)
+
+
+def measure(client_cls, session, requests_:int):
+    latencies = []
+    for i in range(requests_):
+        start = time.perf_counter()
+        client_cls("key", (52.0 + i * 1e-4, 4.0), session=session)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1], latencies[-1]
+
+
+def run(requests_:int):
+    with StubServer() as server:
+        client_cls = server.client_class(DarkSkyClient)
+        print(f"{requests_} sequential requests, latency in ms")
+        print(f"{'session':>10} {'p50':>8} {'p95':>8} {'max':>8}")
+        for name, session in (("unpooled", UnpooledSession()), ("pooled", build_session())):
+            p50, p95, worst = measure(client_cls, session, requests_)
+            print(f"{name:>10} {p50:>8.3f} {p95:>8.3f} {worst:>8.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    run(parser.parse_args().requests)
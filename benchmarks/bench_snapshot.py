@@ -0,0 +1,91 @@
+"""Reloading archived forecasts from JSON files with json.load versus a memory-mapped snapshot file.
+
+Each load runs in a fresh interpreter, so the reported peak RSS belongs to that load alone. After loading, the
+hourly temperatures of every forecast are read through a DSFHourly view.
+
+Run from the repository root:
+    python -m benchmarks.bench_snapshot --forecasts 1000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_snapshot import Snapshot, write_snapshot
+from benchmarks.stub_server import load_fixture
+
+
+def archive(directory:str, forecasts:int):
+    """Writes the recorded response with shifted coordinates as JSON files and as one snapshot file."""
+    raw = json.loads(load_fixture())
+    paths = []
+    for i in range(forecasts):
+        raw["latitude"] = round(50 + i * 0.001, 4)
+        path = os.path.join(directory, f"{i}.json")
+        with open(path, "w") as fh:
+            json.dump(raw, fh)
+        paths.append(path)
+
+    def responses():
+        for path in paths:
+            with open(path) as fh:
+                yield json.load(fh)
+    snapshot = os.path.join(directory, "archive.snap")
+    write_snapshot(snapshot, responses())
+    return paths, snapshot
+
+
+def load(kind:str, paths:list):
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    clients = []
+    if kind == "json":
+        for path in paths:
+            client = DarkSkyClient(None, (0, 0), lazy=True)
+            with open(path) as fh:
+                client.raw_data = json.load(fh)
+            clients.append(client)
+    else:
+        snapshot = Snapshot(paths[0])
+        clients = [snapshot.client(i) for i in range(len(snapshot))]
+    loaded = time.perf_counter() - start
+    for client in clients:
+        client.hourly.temperature
+    total = time.perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    print(json.dumps(dict(loaded=loaded, total=total, rss_kib=rss)))
+
+
+def measure(kind:str, paths:list):
+    output = subprocess.run([sys.executable, "-m", "benchmarks.bench_snapshot", "--load", kind] + paths,
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def run(forecasts:int):
+    with tempfile.TemporaryDirectory() as directory:
+        paths, snapshot = archive(directory, forecasts)
+        json_bytes = sum(os.path.getsize(path) for path in paths)
+        print(f"{forecasts} forecasts, JSON {json_bytes / 2 ** 20:.1f} MiB, "
+              f"snapshot {os.path.getsize(snapshot) / 2 ** 20:.1f} MiB")
+        print(f"{'case':>10} {'load s':>8} {'+ views s':>10} {'peak RSS MiB':>13}")
+        for kind, args in (("json", paths), ("snapshot", [snapshot])):
+            result = measure(kind, args)
+            print(f"{kind:>10} {result['loaded']:>8.3f} {result['total']:>10.3f} {result['rss_kib'] / 1024:>13.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--forecasts", type=int, default=1000)
+    parser.add_argument("--load", choices=("json", "snapshot"), help=argparse.SUPPRESS)
+    parser.add_argument("paths", nargs="*", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.load:
+        load(args.load, args.paths)
+    else:
+        run(args.forecasts)
@@ -0,0 +1,37 @@
+"""Insert and nearest-forecast lookup cost of the spatial index with many indexed points.
+
+Run from the repository root:
+    python -m benchmarks.bench_spatial --points 100000
+"""
+import argparse
+import random
+import time
+
+from DarkSkyAPI.DS_spatial import SpatialIndex
+
+
+def run(points:int, lookups:int, radius_km:float):
+    random.seed(1)
+    # Sites spread over roughly the Netherlands and Belgium
+    coordinates = [(random.uniform(49.5, 53.5), random.uniform(2.5, 7.5)) for _ in range(points)]
+    index = SpatialIndex(cell_size=radius_km / 111.2)
+    start = time.perf_counter()
+    for lat, lon in coordinates:
+        index.insert(lat, lon, None)
+    insert = time.perf_counter() - start
+    queries = [(random.uniform(49.5, 53.5), random.uniform(2.5, 7.5)) for _ in range(lookups)]
+    start = time.perf_counter()
+    hits = sum(1 for lat, lon in queries if index.nearest(lat, lon, radius_km))
+    lookup = time.perf_counter() - start
+    print(f"{points} indexed points, {radius_km} km radius")
+    print(f"insert  {insert / points * 1e6:>8.2f} us/point")
+    print(f"lookup  {lookup / lookups * 1e6:>8.2f} us/query, {hits / lookups:.0%} answered from the index")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=10000)
+    parser.add_argument("--radius", type=float, default=1.0)
+    args = parser.parse_args()
+    run(args.points, args.lookups, args.radius)
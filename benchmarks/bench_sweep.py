@@ -0,0 +1,44 @@
+"""Throughput of the multi-process sweep runner against the local stub server for an increasing amount of processes.
+
+Run from the repository root:
+    python -m benchmarks.bench_sweep
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_sweep import sweep
+from benchmarks.stub_server import StubServer
+
+
+class StubClient(DarkSkyClient):
+    """Module level, so worker processes can import it. base_url is set before the sweep and inherited by forked
+    workers."""
+
+
+def run(locations:int, latency:float, processes:list, max_workers:int):
+    grid = [(50 + i * 0.01, 4 + i * 0.01) for i in range(locations)]
+    print(f"{locations} locations, {latency * 1000:.0f} ms server latency, {max_workers} requests per process, "
+          f"{os.cpu_count()} cores")
+    print(f"{'processes':>9} {'seconds':>9} {'loc/s':>9} {'MiB out':>8} {'errors':>7}")
+    with StubServer(latency=latency) as server, tempfile.TemporaryDirectory() as tmp:
+        StubClient.base_url = server.base_url
+        for n in processes:
+            start = time.perf_counter()
+            stats = sweep("key", grid, os.path.join(tmp, "sweep.ndjson"), processes=n, max_workers=max_workers,
+                          client_cls=StubClient)
+            elapsed = time.perf_counter() - start
+            print(f"{n:>9} {elapsed:>9.2f} {locations / elapsed:>9.1f} {stats['bytes'] / 2 ** 20:>8.1f} "
+                  f"{stats['errors']:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locations", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--max-workers", type=int, default=8)
+    args = parser.parse_args()
+    run(args.locations, args.latency, args.processes, args.max_workers)
@@ -0,0 +1,36 @@
+"""Cost of repeatedly reading datablock properties with memoized views versus rebuilding the view on every access.
+
+Run from the repository root:
+    python -m benchmarks.bench_views
+"""
+import argparse
+import json
+import timeit
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DSForecast import DSFHourly
+from benchmarks.stub_server import load_fixture
+
+
+def run(number:int):
+    client = DarkSkyClient("key", (52.37, 4.89), lazy=True)
+    client.raw_data = json.loads(load_fixture())
+
+    def rebuilt():
+        DSFHourly(client.raw_data['hourly'], 47).temperature
+        DSFHourly(client.raw_data['hourly'], 47).humidity
+
+    def memoized():
+        client.hourly.temperature
+        client.hourly.humidity
+
+    print(f"hourly.temperature + hourly.humidity, {number} iterations")
+    for name, func in (("rebuilt", rebuilt), ("memoized", memoized)):
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:>10} {seconds / number * 1e6:>9.1f} us/iteration")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    run(parser.parse_args().number)
@@ -0,0 +1,99 @@
+"""Minimal benchmark harness: latency percentiles, throughput and peak memory, with baseline comparison."""
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+
+class Case:
+
+    def __init__(self, name:str, func, number:int=100, repeat:int=30):
+        """Constructor method.
+
+        Arguments:
+            name {str} -- Unique name of the case, used to match baselines
+            func {callable} -- The operation to measure, called without arguments
+
+        Keyword Arguments:
+            number {int} -- Calls per sample, the latency of a sample is its time divided by number (default: {100})
+            repeat {int} -- Amount of samples (default: {30})
+        """
+        self.name = name
+        self.func = func
+        self.number = number
+        self.repeat = repeat
+
+
+def percentile(values:list, q:float):
+    values = sorted(values)
+    index = (len(values) - 1) * q / 100
+    low = int(index)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (index - low)
+
+
+def run_case(case:Case):
+    """Measures a case.
+
+    Returns:
+        dict -- p50/p90/p99 latency in microseconds, calls per second and peak traced memory in KiB
+    """
+    func, number = case.func, case.number
+    func()
+    samples = []
+    total = 0.0
+    for _ in range(case.repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        samples.append(elapsed / number * 1e6)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return dict(p50=percentile(samples, 50), p90=percentile(samples, 90), p99=percentile(samples, 99),
+                ops=case.number * case.repeat / total, peak_kib=peak / 1024)
+
+
+def run(cases:list, pattern:str=None):
+    results = {}
+    print(f"{'case':<36} {'p50 us':>10} {'p90 us':>10} {'p99 us':>10} {'ops/s':>10} {'peak KiB':>9}")
+    for case in cases:
+        if pattern and pattern not in case.name:
+            continue
+        result = results[case.name] = run_case(case)
+        print(f"{case.name:<36} {result['p50']:>10.1f} {result['p90']:>10.1f} {result['p99']:>10.1f} "
+              f"{result['ops']:>10.0f} {result['peak_kib']:>9.1f}")
+    return results
+
+
+def save(results:dict, path:str):
+    meta = dict(python=sys.version.split()[0], platform=platform.platform(), time=int(time.time()))
+    with open(path, "w") as fh:
+        json.dump(dict(meta=meta, results=results), fh, indent=2)
+
+
+def compare(results:dict, path:str, threshold:float=0.1):
+    """Prints the p50 change of every case against a saved baseline.
+
+    Returns:
+        list -- Names of the cases whose p50 latency regressed by more than threshold
+    """
+    with open(path) as fh:
+        baseline = json.load(fh)["results"]
+    regressions = []
+    print(f"\n{'case':<36} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["p50"], result["p50"]
+        change = after / before - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<36} {before:>10.1f} {after:>10.1f} {change:>+8.1%}{flag}")
+    return regressions
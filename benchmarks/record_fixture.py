@@ -0,0 +1,31 @@
+"""Records a live DarkSky response as a fixture for the offline benchmarks.
+
+Run from the repository root:
+    python -m benchmarks.record_fixture API_KEY 52.370216 4.895168 --name amsterdam.json
+"""
+import argparse
+import os
+
+from DarkSkyAPI.DS_session import get_session
+from benchmarks.stub_server import FIXTURE_DIR
+
+
+def record(api_key:str, latitude:float, longitude:float, name:str, units:str="si"):
+    url = f"https://api.darksky.net/forecast/{api_key}/{latitude},{longitude}?units={units}"
+    response = get_session().get(url, timeout=(3.05, 30))
+    response.raise_for_status()
+    path = os.path.join(FIXTURE_DIR, name)
+    with open(path, "wb") as fh:
+        fh.write(response.content)
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("api_key")
+    parser.add_argument("latitude", type=float)
+    parser.add_argument("longitude", type=float)
+    parser.add_argument("--name", default="forecast.json")
+    parser.add_argument("--units", default="si")
+    args = parser.parse_args()
+    print(record(args.api_key, args.latitude, args.longitude, args.name, args.units))
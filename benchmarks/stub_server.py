@@ -0,0 +1,102 @@
+"""Local stand-in for the DarkSky forecast endpoint used by the benchmarks.
+
+Every GET request is answered with the recorded fixture in fixtures/forecast.json after an optional artificial
+latency, so the benchmarks can run offline and still exercise the full HTTP path of the client.
+"""
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name:str="forecast.json"):
+    """Returns the raw bytes of a recorded DarkSky response."""
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as fh:
+        return fh.read()
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class StubServer:
+
+    def __init__(self, latency:float=0.0, payload:bytes=None, status:int=200):
+        """Constructor method.
+
+        Keyword Arguments:
+            latency {float} -- Seconds to wait before answering each request (default: {0.0})
+            payload {bytes} -- Response body (default: {the recorded forecast fixture})
+            status {int} -- HTTP status code of every response (default: {200})
+        """
+        self.latency = latency
+        self.payload = payload if payload is not None else load_fixture()
+        self.status = status
+        self.requests = 0
+        self.paths = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests += 1
+                    stub.paths.append(self.path)
+                    calls = stub.requests
+                if stub.latency:
+                    time.sleep(stub.latency)
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(stub.payload)))
+                self.send_header("X-Forecast-API-Calls", str(calls))
+                self.end_headers()
+                self.wfile.write(stub.payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    @property
+    def base_url(self):
+        """str: a DarkSkyClient.base_url template pointing at this server."""
+        host, port = self._server.server_address
+        return f"http://{host}:{port}" + "/forecast/{}/{},{}?units={}"
+
+    @property
+    def time_machine_url(self):
+        """str: a DarkSkyClient.time_machine_url template pointing at this server."""
+        host, port = self._server.server_address
+        return f"http://{host}:{port}" + "/forecast/{}/{},{},{}?units={}"
+
+    def client_class(self, client_cls):
+        """Returns a subclass of client_cls whose requests go to this server."""
+        return type(f"Stub{client_cls.__name__}", (client_cls,),
+                    {"base_url": self.base_url, "time_machine_url": self.time_machine_url})
+
+    def start(self):
+        self._server = _ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -12,8 +12,13 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/suplolx/Python-Weather-wrapper",
-    packages=setuptools.find_packages(),
-    install_requires=["requests"],
+    packages=setuptools.find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
+    install_requires=["requests", "tzdata; platform_system == 'Windows'"],
+    extras_require={
+        "async": ["aiohttp"],
+        "numpy": ["numpy>=1.20"],
+        "arrow": ["pyarrow"],
+    },
     classifiers=(
         "Programming Language :: Python :: 3.6",
         "License :: OSI Approved :: MIT License",
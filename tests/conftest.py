@@ -0,0 +1,20 @@
+import json
+import os
+
+import pytest
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures",
+                       "forecast.json")
+
+
+@pytest.fixture
+def text():
+    """The recorded forecast response as text."""
+    with open(FIXTURE) as fh:
+        return fh.read()
+
+
+@pytest.fixture
+def raw(text):
+    """The recorded forecast response, decoded."""
+    return json.loads(text)
@@ -0,0 +1,40 @@
+import copy
+
+import pytest
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+
+np = pytest.importorskip("numpy")
+from DarkSkyAPI.DS_aggregate import FieldStack  # noqa: E402
+
+
+def client(raw, location, hours:int=0):
+    """Returns a client holding the response with its hourly datapoints moved hours later."""
+    data = copy.deepcopy(raw)
+    for row in data["hourly"]["data"]:
+        row["time"] += hours * 3600
+    c = DarkSkyClient(None, location, lazy=True)
+    c.raw_data = data
+    return c
+
+
+def test_rows_aligned_on_time(raw):
+    hourly = raw["hourly"]["data"]
+    temperatures = [row["temperature"] for row in hourly]
+    stack = FieldStack([client(raw, (1, 1)), client(raw, (2, 2), hours=2)], "hourly", "temperature")
+    assert stack.values.shape == (2, len(hourly) + 2)
+    assert stack.times.tolist() == [row["time"] for row in hourly] + [hourly[-1]["time"] + 3600 * i for i in (1, 2)]
+    assert stack.values[0, :-2].tolist() == temperatures and np.isnan(stack.values[0, -2:]).all()
+    assert stack.values[1, 2:].tolist() == temperatures and np.isnan(stack.values[1, :2]).all()
+    mean = stack.mean(axis=0)
+    assert mean[0] == temperatures[0]
+    assert mean[2] == (temperatures[2] + temperatures[0]) / 2
+    assert stack.count_above(-100, axis=0).tolist() == [1, 1] + [2] * (len(hourly) - 2) + [1, 1]
+
+
+def test_first_points(raw):
+    hourly = raw["hourly"]["data"]
+    stack = FieldStack([client(raw, (1, 1)), client(raw, (2, 2), hours=2)], "hourly", "temperature", n=5)
+    assert stack.times.tolist() == [row["time"] for row in hourly[:7]]
+    assert np.isnan(stack.values[0, 5:]).all() and np.isnan(stack.values[1, :2]).all()
+    assert stack.rolling(3).shape == (2, 5)
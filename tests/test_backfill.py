@@ -0,0 +1,55 @@
+from datetime import date
+from itertools import islice
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_backfill import Checkpoint, backfill, date_grid
+from benchmarks.stub_server import StubServer
+
+LOCATIONS = [(52.37, 4.89), (51.92, 4.48)]
+START, END = date(2018, 10, 1), date(2018, 10, 5)
+
+
+def requested(paths:list):
+    """Returns the (location, date) pairs of Time Machine request paths."""
+    pairs = set()
+    for path in paths:
+        lat, lon, moment = path.split("?")[0].rsplit("/", 1)[1].split(",")
+        pairs.add(((float(lat), float(lon)), date.fromisoformat(moment[:10])))
+    return pairs
+
+
+def test_resume(tmp_path):
+    checkpoint = str(tmp_path / "backfill.txt")
+    grid = set(date_grid(LOCATIONS, START, END))
+    with StubServer() as server:
+        client_cls = server.client_class(DarkSkyClient)
+        records = backfill("key", LOCATIONS, START, END, checkpoint=checkpoint, max_workers=2, client_cls=client_cls)
+        first = [(record.location, record.date) for record in islice(records, 4)]
+        records.close()
+        done = Checkpoint(checkpoint)
+        finished = {pair for pair in grid if pair in done}
+        done.close()
+        # The last record was handed out but not consumed when the run stopped, it is requested again
+        assert finished == set(first[:3])
+
+        server.paths.clear()
+        second = list(backfill("key", LOCATIONS, START, END, checkpoint=checkpoint, max_workers=2,
+                               client_cls=client_cls))
+        assert requested(server.paths) == grid - finished
+        assert {(record.location, record.date) for record in second} == grid - finished
+        assert all(record.error is None and record.data["timezone"] for record in second)
+
+        server.paths.clear()
+        assert list(backfill("key", LOCATIONS, START, END, checkpoint=checkpoint, client_cls=client_cls)) == []
+        assert server.paths == []
+
+
+def test_failed_pairs_are_retried(tmp_path):
+    checkpoint = str(tmp_path / "backfill.txt")
+    with StubServer(status=404) as server:
+        client_cls = server.client_class(DarkSkyClient)
+        records = list(backfill("key", LOCATIONS[:1], START, START, checkpoint=checkpoint, client_cls=client_cls))
+        assert len(records) == 1 and records[0].error is not None
+        server.status = 200
+        records = list(backfill("key", LOCATIONS[:1], START, START, checkpoint=checkpoint, client_cls=client_cls))
+        assert len(records) == 1 and records[0].error is None
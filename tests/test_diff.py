@@ -0,0 +1,100 @@
+import asyncio
+import copy
+import json
+
+import pytest
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_diff import affected_blocks, apply_diff, diff_forecast
+from benchmarks.stub_server import StubServer
+
+@pytest.fixture
+def old(raw):
+    return raw
+
+
+@pytest.fixture
+def new(old):
+    data = copy.deepcopy(old)
+    data["currently"]["temperature"] += 1
+    del data["currently"]["ozone"]
+    hourly = data["hourly"]["data"]
+    hourly.pop(0)
+    hourly.append(dict(hourly[-1], time=hourly[-1]["time"] + 3600))
+    hourly[3]["humidity"] = 0.5
+    del hourly[4]["precipType"]
+    hourly[5]["windGust"] = None
+    data["hourly"]["summary"] = "Rain all day."
+    data["alerts"] = [{"title": "Storm"}]
+    del data["flags"]
+    return data
+
+
+def test_round_trip(old, new):
+    assert apply_diff(old, diff_forecast(old, new)) == new
+    assert apply_diff(new, diff_forecast(new, old)) == old
+    assert apply_diff({}, diff_forecast({}, new)) == new
+
+
+def test_diff_contents(old, new):
+    diff = diff_forecast(old, new)
+    assert set(diff) == {"currently", "hourly", "alerts", "flags"}
+    assert diff["currently"] == {"changed": {"temperature": new["currently"]["temperature"]}, "removed": ["ozone"]}
+    hourly = diff["hourly"]
+    assert hourly["summary"] == "Rain all day." and "icon" not in hourly
+    assert hourly["removed"] == [old["hourly"]["data"][0]["time"]]
+    assert list(hourly["added"]) == [new["hourly"]["data"][-1]["time"]]
+    points = new["hourly"]["data"]
+    assert hourly["changed"] == {points[3]["time"]: {"changed": {"humidity": 0.5}},
+                                 points[4]["time"]: {"removed": ["precipType"]},
+                                 points[5]["time"]: {"changed": {"windGust": None}}}
+    assert diff["alerts"] == {"value": new["alerts"]}
+    assert diff["flags"] is None
+    assert affected_blocks(diff) == {"currently", "hourly", "alerts", "flags"}
+
+
+def test_unchanged(old):
+    assert diff_forecast(old, copy.deepcopy(old)) == {}
+
+
+def test_explicit_null_is_not_a_removal(old):
+    new = copy.deepcopy(old)
+    new["currently"]["windGust"] = None
+    diff = diff_forecast(old, new)
+    assert diff == {"currently": {"changed": {"windGust": None}}}
+    result = apply_diff(old, diff)
+    assert "windGust" in result["currently"] and result["currently"]["windGust"] is None
+
+
+def test_refresh_incremental(old, new):
+    with StubServer() as server:
+        client = server.client_class(DarkSkyClient)("key", (52.37, 4.89), lazy=True)
+        diffs = []
+        client.subscribe(lambda client, diff: diffs.append(diff))
+        assert "hourly" in client.refresh_incremental()
+        hourly, daily = client.hourly, client.daily
+        assert client.refresh_incremental(force=True) == {}
+        server.payload = json.dumps(new).encode()
+        diff = client.refresh_incremental(force=True)
+    assert diffs == [diffs[0], diff]
+    assert client.daily is daily and client.hourly is not hourly
+    assert client.raw_data == new
+
+
+def test_async_refresh_incremental(old, new):
+    pytest.importorskip("aiohttp")
+    from DarkSkyAPI.DS_async import AsyncDarkSkyClient
+
+    async def refresh(client, server):
+        await client.fetch()
+        server.payload = json.dumps(old).encode()
+        return await client.refresh_incremental(force=True)
+
+    with StubServer(payload=json.dumps(new).encode()) as server:
+        client = server.client_class(AsyncDarkSkyClient)("key", (52.37, 4.89))
+        diffs = []
+        client.subscribe(lambda client, diff: diffs.append(diff))
+        assert asyncio.run(refresh(client, server)) == diff_forecast(new, old)
+    assert diffs == [diff_forecast(new, old)]
+    with pytest.raises(RuntimeError):
+        client.refresh()
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from DarkSkyAPI.DS_lazy import LazyForecast
+
+def test_recorded_response(text):
+    forecast = LazyForecast(text)
+    expected = json.loads(text)
+    assert forecast["daily"] == expected["daily"]
+    assert forecast.decoded == ["daily"]
+    assert "hourly" in forecast and "alerts" not in forecast
+    assert dict(forecast) == expected
+    assert list(forecast) == list(expected)
+
+
+@pytest.mark.parametrize("separators", [(",", ":"), (", ", ": "), (",\n", " :\t")])
+def test_whitespace(text, separators):
+    data = json.loads(text)
+    forecast = LazyForecast(json.dumps(data, separators=separators))
+    assert forecast["currently"] == data["currently"]
+    assert forecast["offset"] == data["offset"]
+
+
+def test_keys_out_of_order(text):
+    data = json.loads(text)
+    shuffled = {key: data[key] for key in reversed(list(data))}
+    forecast = LazyForecast(json.dumps(shuffled))
+    assert forecast["latitude"] == data["latitude"]
+    assert forecast["daily"] == data["daily"]
+    assert dict(forecast) == data
+
+
+def test_key_names_inside_strings():
+    data = {"latitude": 1.5, "currently": {"summary": 'Quote "daily": {"x": 1}'}, "daily": {"data": [1]}}
+    forecast = LazyForecast(json.dumps(data))
+    assert forecast["daily"] == data["daily"]
+    assert forecast["currently"] == data["currently"]
+
+
+def test_unknown_top_level_keys():
+    data = {"latitude": 1.5, "currently": {"time": 1}, "health": {"status": "ok"}, "offset": 2}
+    forecast = LazyForecast(json.dumps(data))
+    assert forecast["currently"] == data["currently"]
+    assert "health" in forecast
+    assert forecast["health"] == data["health"]
+    assert len(forecast) == 4
+    assert dict(forecast) == data
+
+
+def test_missing_keys():
+    forecast = LazyForecast(json.dumps({"latitude": 1.5}))
+    with pytest.raises(KeyError):
+        forecast["hourly"]
+    with pytest.raises(KeyError):
+        forecast["unknown"]
+    assert forecast.get("alerts") is None
+    assert "unknown" not in forecast
+
+
+def test_decoded_blocks_keep_identity(text):
+    forecast = LazyForecast(text)
+    daily = forecast["daily"]
+    list(forecast)
+    assert forecast["daily"] is daily
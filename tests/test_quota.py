@@ -0,0 +1,96 @@
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from DarkSkyAPI.DS_quota import QuotaExceeded, QuotaLimiter
+
+
+def acquire_many(limiter, n:int):
+    """Runs in a worker process: acquires n calls and returns how many were rejected."""
+    rejected = 0
+    for _ in range(n):
+        try:
+            limiter.acquire()
+        except QuotaExceeded:
+            rejected += 1
+    return rejected
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "quota.db")
+
+
+def test_threads(path):
+    limiter = QuotaLimiter(path, daily_limit=1000)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert sum(executor.map(acquire_many, [limiter] * 8, [25] * 8)) == 0
+    assert limiter.metrics == dict(used=200, remaining=800, rejected=0, wait_time=0.0)
+
+
+def test_processes(path):
+    limiter = QuotaLimiter(path, daily_limit=1000)
+    limiter.acquire()
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        assert sum(executor.map(acquire_many, [limiter] * 4, [20] * 4)) == 0
+    assert limiter.metrics["used"] == 81
+
+
+def test_pickle(path):
+    limiter = QuotaLimiter(path, daily_limit=10)
+    limiter.acquire()
+    copy = pickle.loads(pickle.dumps(limiter))
+    copy.acquire()
+    assert copy.metrics["used"] == limiter.metrics["used"] == 2
+
+
+def test_daily_limit(path):
+    limiter = QuotaLimiter(path, daily_limit=30)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert sum(executor.map(acquire_many, [limiter] * 4, [10] * 4)) == 10
+    with pytest.raises(QuotaExceeded):
+        limiter.acquire()
+    assert limiter.metrics == dict(used=30, remaining=0, rejected=11, wait_time=0.0)
+
+
+def test_update(path):
+    limiter = QuotaLimiter(path, daily_limit=100)
+    limiter.acquire()
+    limiter.update(40)
+    limiter.update(10)
+    assert limiter.metrics["used"] == 40
+
+
+def test_rate_waits(path):
+    limiter = QuotaLimiter(path, rate=20, burst=2)
+    start = time.perf_counter()
+    for _ in range(6):
+        limiter.acquire()
+    # Two calls from the burst, the other four wait for a token each
+    assert time.perf_counter() - start >= 4 / 20 * 0.9
+    metrics = limiter.metrics
+    assert metrics["used"] == 6 and metrics["rejected"] == 0 and metrics["wait_time"] > 0
+
+
+def test_rate_refill(path):
+    limiter = QuotaLimiter(path, rate=20, burst=2, block=False)
+    limiter.acquire()
+    limiter.acquire()
+    time.sleep(0.1)
+    limiter.acquire()
+    assert limiter.metrics["used"] == 3
+
+
+def test_rate_rejects(path):
+    limiter = QuotaLimiter(path, rate=1, burst=1, block=False)
+    limiter.acquire()
+    with pytest.raises(QuotaExceeded):
+        limiter.acquire()
+    waiting = QuotaLimiter(path, rate=1, burst=1, max_wait=0.1)
+    start = time.perf_counter()
+    with pytest.raises(QuotaExceeded):
+        waiting.acquire()
+    assert time.perf_counter() - start < 0.5
+    assert limiter.metrics == dict(used=1, remaining=999, rejected=2, wait_time=0.0)
@@ -0,0 +1,42 @@
+import time
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_cache import DiskCache, MemoryCache
+from benchmarks.stub_server import StubServer
+
+
+def test_force_bypasses_cache():
+    cache = MemoryCache()
+    with StubServer() as server:
+        client = server.client_class(DarkSkyClient)("key", (52.37, 4.89), cache=cache)
+        assert server.requests == 1
+        assert not client.refresh()
+        assert client.refresh(force=True)
+        assert server.requests == 2
+        assert client.refresh_incremental(force=True) == {}
+        assert server.requests == 3
+
+
+def test_cached_response_keeps_its_age():
+    cache = MemoryCache()
+    with StubServer() as server:
+        stub_cls = server.client_class(DarkSkyClient)
+        first = stub_cls("key", (52.37, 4.89), cache=cache)
+        stored_at = first.fetched_at
+        time.sleep(0.1)
+        second = stub_cls("key", (52.37, 4.89), cache=cache)
+        assert server.requests == 1
+    assert second.fetched_at == cache.get_entry(second.cache_key)[1]
+    assert abs(second.fetched_at - stored_at) < 0.05
+    assert second.is_stale(max_age=0.05)
+
+
+def test_disk_cache_entry(tmp_path, raw):
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    before = time.time()
+    cache.set("key", raw)
+    data, stored_at = cache.get_entry("key")
+    assert data == raw and before <= stored_at <= time.time()
+    assert cache.get("key") == raw
+    assert cache.get_entry("missing") is None
+    cache.close()
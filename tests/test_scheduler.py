@@ -0,0 +1,49 @@
+import time
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_scheduler import ForecastScheduler
+from benchmarks.stub_server import StubServer
+
+INTERVALS = {"currently": 0.2, "minutely": None, "hourly": None, "daily": None}
+
+
+def wait_for(condition, timeout:float=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_restart():
+    with StubServer() as server:
+        scheduler = ForecastScheduler("key", [(52.37, 4.89)], intervals=INTERVALS, jitter=0,
+                                      client_cls=server.client_class(DarkSkyClient))
+        scheduler.start()
+        assert wait_for(lambda: server.requests >= 1)
+        scheduler.stop()
+        requests = server.requests
+        scheduler.start()
+        assert wait_for(lambda: server.requests > requests)
+        assert scheduler._thread.is_alive()
+        scheduler.stop()
+
+
+def test_failed_round_keeps_running():
+    with StubServer() as server:
+        scheduler = ForecastScheduler("key", [(52.37, 4.89)], intervals=INTERVALS, jitter=0,
+                                      client_cls=server.client_class(DarkSkyClient))
+        run_pending = scheduler.run_pending
+        rounds = []
+
+        def failing_once():
+            rounds.append(None)
+            if len(rounds) == 1:
+                raise RuntimeError("round failed")
+            return run_pending()
+
+        scheduler.run_pending = failing_once
+        scheduler.start()
+        assert wait_for(lambda: server.requests >= 1)
+        assert scheduler._thread.is_alive()
+        scheduler.stop()
+    assert scheduler.clients[(52.37, 4.89)]._raw_data is not None
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_singleflight import AsyncSingleFlight, SingleFlight
+from benchmarks.stub_server import StubServer
+
+N = 10
+
+
+def test_threads_share_one_request():
+    group = SingleFlight()
+    barrier = threading.Barrier(N)
+    with StubServer(latency=0.2) as server:
+        client_cls = server.client_class(DarkSkyClient)
+
+        def fetch(_):
+            client = client_cls("key", (52.37, 4.89), lazy=True, singleflight=group)
+            barrier.wait()
+            return client.raw_data
+
+        with ThreadPoolExecutor(max_workers=N) as executor:
+            results = list(executor.map(fetch, range(N)))
+    assert server.requests == 1
+    assert group.calls == 1 and group.shared == N - 1
+    assert all(result is results[0] for result in results)
+
+
+def test_threads_share_errors():
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait()
+        raise ValueError("request failed")
+
+    def call():
+        try:
+            return group.do("url", fail)
+        except ValueError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=N) as executor:
+        futures = [executor.submit(call) for _ in range(N)]
+        while group.calls + group.shared < N:
+            time.sleep(0.01)
+        release.set()
+        errors = [future.result() for future in futures]
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert group.calls == 1 and group.shared == N - 1
+
+
+def test_async_share_one_request():
+    pytest.importorskip("aiohttp")
+    from DarkSkyAPI.DS_async import AsyncDarkSkyClient
+
+    group = AsyncSingleFlight()
+
+    async def fetch_all(client_cls):
+        clients = [client_cls("key", (52.37, 4.89), singleflight=group) for _ in range(N)]
+        return await asyncio.gather(*(client.fetch() for client in clients))
+
+    with StubServer(latency=0.2) as server:
+        clients = asyncio.run(fetch_all(server.client_class(AsyncDarkSkyClient)))
+    assert server.requests == 1
+    assert group.calls == 1 and group.shared == N - 1
+    assert all(client.raw_data is clients[0].raw_data for client in clients)
@@ -0,0 +1,80 @@
+import copy
+
+import pytest
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_snapshot import Snapshot, write_snapshot
+
+@pytest.fixture
+def sparse(raw):
+    data = copy.deepcopy(raw)
+    hourly = data["hourly"]["data"]
+    del hourly[3]["uvIndex"]
+    del hourly[4]["summary"]
+    hourly[5]["precipType"] = "snow"
+    hourly[6]["windGust"] = None
+    hourly[7]["flag"] = True
+    data["currently"]["windGust"] = None
+    data["daily"]["data"][2]["precipAccumulation"] = 1
+    data["alerts"] = [{"title": "Storm", "regions": ["Noord-Holland"], "expires": 1539900000}]
+    return data
+
+
+def as_dict(forecast):
+    """Materializes a snapshot forecast into plain dicts and lists."""
+    result = {}
+    for key, value in forecast.items():
+        if isinstance(value, dict) and "data" in value:
+            value = dict(value, data=list(value["data"]))
+        result[key] = value
+    return result
+
+
+@pytest.fixture
+def snapshot(tmp_path, raw, sparse):
+    path = str(tmp_path / "forecasts.snap")
+    assert write_snapshot(path, [raw, sparse]) == 2
+    with Snapshot(path) as snapshot:
+        yield snapshot
+
+
+def test_round_trip(snapshot, raw, sparse):
+    assert len(snapshot) == 2
+    assert as_dict(snapshot[0]) == raw
+    assert as_dict(snapshot[1]) == sparse
+
+
+def test_sparse_and_string_columns(snapshot, sparse):
+    hourly = snapshot[1]["hourly"]["data"]
+    assert "uvIndex" not in hourly[3] and isinstance(hourly[2]["uvIndex"], int)
+    assert "summary" not in hourly[4]
+    assert hourly[5]["precipType"] == "snow"
+    assert hourly[7]["flag"] is True and "flag" not in hourly[8]
+    assert hourly[-1] == sparse["hourly"]["data"][-1]
+    assert hourly[1:3] == sparse["hourly"]["data"][1:3]
+
+
+def test_explicit_nulls(snapshot):
+    hourly = snapshot[1]["hourly"]["data"]
+    assert "windGust" in hourly[6] and hourly[6]["windGust"] is None
+    assert "windGust" in snapshot[1]["currently"] and snapshot[1]["currently"]["windGust"] is None
+
+
+def test_views(snapshot, sparse):
+    stored = snapshot.client(1)
+    parsed = DarkSkyClient(None, (0, 0), lazy=True)
+    parsed.raw_data = sparse
+    for block in ("minutely", "hourly", "daily"):
+        expected, actual = getattr(parsed, block), getattr(stored, block)
+        assert actual.data_combined() == expected.data_combined()
+        for datapoint in ("time", "summary", "icon", "precipType", "uvIndex", "windGust", "flag"):
+            assert actual.column(datapoint) == expected.column(datapoint)
+    assert stored.hourly.humidity == parsed.hourly.humidity
+    assert stored.currently.temperature == parsed.currently.temperature
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / "forecast.json"
+    path.write_text("{}")
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
@@ -0,0 +1,29 @@
+import json
+
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DS_sweep import to_record
+
+
+def test_record_has_every_datapoint(raw):
+    client = DarkSkyClient(None, (raw["latitude"], raw["longitude"]), lazy=True)
+    client.raw_data = raw
+    record = to_record(client, ("currently", "minutely", "hourly", "daily"))
+    for block in ("minutely", "hourly", "daily"):
+        rows = raw[block]["data"]
+        datapoints = {k for row in rows for k in row}
+        assert set(record[block]) == datapoints
+        assert all(len(column) == len(rows) for column in record[block].values())
+    assert "precipType" not in raw["daily"]["data"][0]
+    assert record["daily"]["precipType"] == [row.get("precipType") for row in raw["daily"]["data"]]
+    assert record["currently"] == raw["currently"]
+    json.dumps(record)
+
+
+def test_record_fields(raw):
+    client = DarkSkyClient(None, (raw["latitude"], raw["longitude"]), lazy=True)
+    client.raw_data = raw
+    record = to_record(client, ("hourly",), fields=["temperature"], date_fmt="%H")
+    assert list(record) == ["location", "timezone", "hourly"]
+    assert list(record["hourly"]) == ["time", "temperature"]
+    assert len(record["hourly"]["time"]) == len(raw["hourly"]["data"])
+    assert record["hourly"]["temperature"] == [row["temperature"] for row in raw["hourly"]["data"]]
@@ -0,0 +1,16 @@
+from DarkSkyAPI.DarkSkyAPI import DarkSkyClient
+from DarkSkyAPI.DSForecast import DSFHourly, timestamp
+
+
+def test_forecast_timezone(raw):
+    assert timestamp(1539813600, "%H:%M %z", "Europe/Amsterdam") == "00:00 +0200"
+    client = DarkSkyClient(None, (raw["latitude"], raw["longitude"]), lazy=True)
+    client.raw_data = raw
+    assert client.hourly.datetimes("%z")[0] == "+0200"
+
+
+def test_unknown_timezone_uses_local_time(raw):
+    assert timestamp(1539813600, "%Y-%m-%d %H:%M", "No/Such_Zone") == timestamp(1539813600, "%Y-%m-%d %H:%M")
+    client = DarkSkyClient(None, (raw["latitude"], raw["longitude"]), lazy=True)
+    client.raw_data = dict(raw, timezone="No/Such_Zone")
+    assert client.hourly.datetimes() == DSFHourly(raw["hourly"], 47).datetimes()